@@ -0,0 +1,188 @@
+"""
+Numba kernels for the simulation hot path.
+
+Numba is an optional dependency (``pip install lec-sim[fast]``). Without it,
+HAVE_NUMBA is False, the kernels below run as plain Python, and callers use
+their NumPy paths instead.
+
+Backend order is Numba, then vectorized NumPy. NumPy is a hard dependency,
+so the vectorized path is always available and there is deliberately no
+compiled (Cython/C) fallback: it would never be selected, and would turn
+this pure-Python package into one that needs a compiler to build.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+@njit(cache=True)
+def win_series(threshold: np.uint32, games_to_win: int, draws: np.ndarray) -> bool:
+    """
+    Decide a series from its game draws: True if team_a takes it.
+
+    Whoever wins the majority of the first 2 * games_to_win - 1 draws is
+    whoever reaches games_to_win first; the fixed trip count keeps the loop
+    branch-free.
+
+    Args:
+        threshold: P(team_a wins a game) as a uint32 fixed-point threshold
+            (see lec_sim.fixed_point)
+        games_to_win: Games needed to take the series
+        draws: uint32 game draws, at least 2 * games_to_win - 1 of them
+    """
+    a_games = 0
+    for k in range(2 * games_to_win - 1):
+        a_games += draws[k] < threshold
+    return a_games >= games_to_win
+
+
+@njit(parallel=True, cache=True)
+def tally_round_robin_draws(
+    a_idx: np.ndarray,
+    b_idx: np.ndarray,
+    threshold: np.ndarray,
+    games_to_win: np.ndarray,
+    draws: np.ndarray,
+    wins_out: np.ndarray,
+    losses_out: np.ndarray,
+    h2h_out: np.ndarray,
+) -> None:
+    """
+    Play the remaining round-robin matches for a batch of simulations.
+
+    Every game draw comes from the caller, so results depend only on the
+    generator that produced them (not on thread scheduling).
+
+    Args:
+        a_idx, b_idx: Standings rows of each match's teams, shape (M,)
+        threshold: P(team_a wins a game) for each match as a uint32
+            fixed-point threshold (see lec_sim.fixed_point), shape (M,)
+        games_to_win: Games needed to take each match (1 for Bo1), shape (M,)
+        draws: uint32 game draws, shape (S, M, max games); match m reads the
+            first 2 * games_to_win[m] - 1 of its row
+        wins_out, losses_out: (S, N) records, pre-filled with the baseline
+        h2h_out: (S, N, N, 2) head-to-head records, pre-filled with the baseline
+    """
+    for s in prange(draws.shape[0]):
+        for m in range(a_idx.shape[0]):
+            if win_series(threshold[m], games_to_win[m], draws[s, m]):
+                winner, loser = a_idx[m], b_idx[m]
+            else:
+                winner, loser = b_idx[m], a_idx[m]
+            wins_out[s, winner] += 1
+            losses_out[s, loser] += 1
+            h2h_out[s, winner, loser, 0] += 1
+            h2h_out[s, loser, winner, 1] += 1
+
+
+@njit(parallel=True, cache=True)
+def play_brackets(
+    seed_rows: np.ndarray,
+    thresholds: np.ndarray,
+    draws: np.ndarray,
+    bracket: np.ndarray,
+    placement_slots: np.ndarray,
+    placed_out: np.ndarray,
+) -> None:
+    """
+    Play out the playoff bracket for a batch of simulations.
+
+    Args:
+        seed_rows: Standings rows of seeds 1-8 in each simulation, shape (S, 8)
+        thresholds: P(row i beats row j in a game) as uint32 fixed-point
+            thresholds, shape (N, N)
+        draws: uint32 game draws, shape (S, positions, max games); the match
+            at position k reads the first 2 * games_to_win - 1 of draws[s, k]
+        bracket: (team_a slot, team_b slot, games to win) of each position,
+            in play order (playoffs.BRACKET_SLOTS)
+        placement_slots: Slots holding places 1-8 (playoffs.PLACEMENT_SLOTS)
+        placed_out: Standings rows in final placement order (1st to 8th),
+            shape (S, 8)
+    """
+    num_slots = 8 + 2 * bracket.shape[0]
+    for s in prange(seed_rows.shape[0]):
+        slots = np.empty(num_slots, dtype=np.int64)
+        slots[:8] = seed_rows[s]
+        for k in range(bracket.shape[0]):
+            a = slots[bracket[k, 0]]
+            b = slots[bracket[k, 1]]
+            if win_series(thresholds[a, b], bracket[k, 2], draws[s, k]):
+                slots[8 + 2 * k], slots[9 + 2 * k] = a, b
+            else:
+                slots[8 + 2 * k], slots[9 + 2 * k] = b, a
+        for p in range(placement_slots.shape[0]):
+            placed_out[s, p] = slots[placement_slots[p]]
+
+
+@njit(cache=True)
+def _ranks_ahead(
+    x: int,
+    y: int,
+    wins: np.ndarray,
+    h2h_diff: np.ndarray,
+    sov: np.ndarray,
+    coin_rank: np.ndarray,
+) -> bool:
+    """True if row x ranks ahead of row y under the default tiebreaker chain."""
+    if wins[x] != wins[y]:
+        return wins[x] > wins[y]
+    if h2h_diff[x] != h2h_diff[y]:
+        return h2h_diff[x] > h2h_diff[y]
+    if sov[x] != sov[y]:
+        return sov[x] > sov[y]
+    return coin_rank[x] < coin_rank[y]
+
+
+@njit(parallel=True, cache=True)
+def order_standings(
+    wins: np.ndarray,
+    h2h: np.ndarray,
+    coin_rank: np.ndarray,
+    orders_out: np.ndarray,
+) -> None:
+    """
+    Order standings rows from 1st to last for a batch of simulations.
+
+    Args:
+        wins: Wins by standings row, shape (S, N)
+        h2h: Head-to-head records, shape (S, N, N, 2)
+        coin_rank: Coinflip priority of each row (lower first), shape (S, N)
+        orders_out: Standings rows from 1st to last, shape (S, N)
+    """
+    n = wins.shape[1]
+    for s in prange(wins.shape[0]):
+        # H2H differential among the rows on the same wins, and strength of
+        # victory (the wins of every beaten opponent, once per win)
+        h2h_diff = np.zeros(n, dtype=np.int64)
+        sov = np.zeros(n, dtype=np.int64)
+        for i in range(n):
+            for j in range(n):
+                if wins[s, j] == wins[s, i]:
+                    h2h_diff[i] += np.int64(h2h[s, i, j, 0]) - h2h[s, i, j, 1]
+                sov[i] += np.int64(h2h[s, i, j, 0]) * wins[s, j]
+
+        # Insertion sort: there are only a dozen rows
+        order = orders_out[s]
+        for i in range(n):
+            k = i
+            while k > 0 and _ranks_ahead(
+                i, order[k - 1], wins[s], h2h_diff, sov, coin_rank[s]
+            ):
+                order[k] = order[k - 1]
+                k -= 1
+            order[k] = i
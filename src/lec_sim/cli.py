@@ -26,13 +26,15 @@ def cmd_simulate(args: argparse.Namespace) -> int:
         loader = StateLoader()
         tournament = loader.load_from_file(state_path)
 
-        completed = len(tournament.get_completed_round_robin_matches())
-        remaining = len(tournament.get_remaining_round_robin_matches())
+        # Scan the schedule once; the engine reuses this list
+        remaining = tournament.get_remaining_round_robin_matches()
+        completed = len(tournament.round_robin_matches) - len(remaining)
         print(f"Matches completed: {completed}")
-        print(f"Matches remaining: {remaining}")
+        print(f"Matches remaining: {len(remaining)}")
     else:
         print("Starting fresh tournament (no completed matches)")
         tournament = create_empty_tournament()
+        remaining = tournament.get_remaining_round_robin_matches()
 
     # Create win rate matrix
     win_rates = WinRateMatrix.uniform(args.win_rate)
@@ -41,6 +43,7 @@ def cmd_simulate(args: argparse.Namespace) -> int:
     config = SimulationConfig(
         num_simulations=args.simulations,
         seed=args.seed,
+        num_workers=args.workers,
     )
 
     print(f"\nRunning {config.num_simulations:,} simulations...")
@@ -48,7 +51,7 @@ def cmd_simulate(args: argparse.Namespace) -> int:
         print(f"Random seed: {args.seed}")
 
     # Run simulation
-    engine = SimulationEngine(tournament, win_rates, config)
+    engine = SimulationEngine(tournament, win_rates, config, remaining=remaining)
     results = engine.run()
 
     # Print results
@@ -158,6 +161,12 @@ def main() -> int:
         default=0.5,
         help="Default win rate for all matchups (default: 0.5)",
     )
+    sim_parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=1,
+        help="Worker processes to run simulations in (default: 1, 0 = all cores)",
+    )
     sim_parser.add_argument(
         "--output", "-o",
         help="Output file path for results JSON",
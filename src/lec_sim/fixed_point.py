@@ -0,0 +1,25 @@
+"""
+Fixed-point win probabilities for the simulation kernels.
+
+Every batch path (the Numba kernels and their NumPy fallbacks) uses the same
+scale: a probability p is stored as the uint32 threshold
+t = round(p * 2**32), saturated at 2**32 - 1, and an event happens iff a
+uniform 32-bit draw u is below t. Thresholds are built from the float64
+probabilities (WinRateMatrix.probs), so each is off by at most 2^-32, the
+saturation of p = 1 included, far below Monte Carlo sampling noise; p = 0
+and p = 0.5 are exact.
+"""
+
+import numpy as np
+
+# Draws are uniform on [0, FIXED_POINT_ONE)
+FIXED_POINT_ONE = 1 << 32
+
+
+def to_fixed_point(probs: np.ndarray) -> np.ndarray:
+    """Quantize probabilities in [0, 1] to uint32 fixed-point thresholds."""
+    probs = np.asarray(probs, dtype=np.float64)
+    if np.any((probs < 0.0) | (probs > 1.0)):
+        raise ValueError("Fixed-point probabilities must be between 0 and 1")
+    thresholds = np.minimum(np.round(probs * FIXED_POINT_ONE), FIXED_POINT_ONE - 1)
+    return thresholds.astype(np.uint32)
@@ -1,17 +1,25 @@
 """Results output and formatting."""
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 from lec_sim.simulation.engine import SimulationResults
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def save_results_to_json(
     results: SimulationResults,
-    path: Optional[Path] = None,
-    results_dir: Path = Path("data/results"),
+    path: Optional[Union[str, os.PathLike[str]]] = None,
+    results_dir: Union[str, os.PathLike[str]] = Path("data/results"),
+    *,
+    timestamp: Optional[datetime] = None,
 ) -> Path:
     """
     Save simulation results to a JSON file.
@@ -20,22 +28,36 @@ def save_results_to_json(
         results: The simulation results to save
         path: Specific file path. If None, generates timestamped filename.
         results_dir: Directory for results (used if path is None)
+        timestamp: Time recorded in the file (and its generated name).
+            Defaults to now; pass a fixed value for byte-identical output
+            from seeded runs.
 
     Returns:
         Path to the saved file
     """
+    # One timestamp, so the filename and the recorded time always agree
+    now = timestamp if timestamp is not None else datetime.now()
+
     if path is None:
+        results_dir = Path(results_dir)
         results_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        path = results_dir / f"sim_{timestamp}.json"
+        path = results_dir / f"sim_{now.strftime('%Y%m%d_%H%M%S')}.json"
+    else:
+        path = Path(path)
 
     data = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
         "results": results.to_dict(),
     }
 
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    if orjson is not None:
+        # Int keys (ranks, seeds) are stringified the same way json.dump does
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=options))
+    else:
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
 
     return path
 
@@ -2,17 +2,18 @@
 
 import json
 from pathlib import Path
-from typing import Optional
-from uuid import UUID
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 from lec_sim.models.team import Team
-from lec_sim.models.match import Match, MatchFormat, MatchResult
+from lec_sim.models.match import MatchFormat, MatchResult
 from lec_sim.models.standing import Standings
 from lec_sim.tournament.tournament import Tournament
 from lec_sim.tournament.round_robin import generate_round_robin_schedule
 
 
-# Default LEC 2026 Versus teams
+# Default LEC 2026 Versus teams. IDs come from Team's shared counter, so no
+# other team in the process can reuse them
 DEFAULT_TEAMS = [
     Team(name="Fnatic", short_name="FNC"),
     Team(name="G2 Esports", short_name="G2"),
@@ -34,9 +35,9 @@ def get_default_teams() -> list[Team]:
     return DEFAULT_TEAMS.copy()
 
 
-def create_team_lookup(teams: list[Team]) -> dict[str, Team]:
-    """Create a lookup dict from short_name to Team."""
-    return {t.short_name: t for t in teams}
+def create_team_lookup(teams: list[Team]) -> Mapping[str, Team]:
+    """Create a read-only lookup from short_name to Team."""
+    return MappingProxyType({t.short_name: t for t in teams})
 
 
 class StateLoader:
@@ -66,11 +67,14 @@ class StateLoader:
         # Process completed matches from data
         completed_matches = data.get("completed_matches", [])
 
-        # Build a lookup for matches by teams
-        match_lookup: dict[tuple[UUID, UUID], Match] = {}
-        for match in tournament.round_robin_matches:
-            key = tuple(sorted([match.team_a.id, match.team_b.id]))
-            match_lookup[key] = match
+        # Schedule index of the match between any two teams (by standings row)
+        rows = tournament.standings.team_index
+        match_grid = tournament.match_grid
+        schedule = tournament.round_robin_matches
+
+        # Bound once, outside the loop
+        lookup = self._team_lookup.get
+        record = tournament.record_round_robin_result
 
         # Record completed match results
         for match_data in completed_matches:
@@ -78,9 +82,9 @@ class StateLoader:
             team_b_name = match_data.get("team_b")
             winner_name = match_data.get("winner")
 
-            team_a = self._team_lookup.get(team_a_name)
-            team_b = self._team_lookup.get(team_b_name)
-            winner = self._team_lookup.get(winner_name)
+            team_a = lookup(team_a_name)
+            team_b = lookup(team_b_name)
+            winner = lookup(winner_name)
 
             if not team_a or not team_b or not winner:
                 continue  # Skip invalid entries
@@ -89,17 +93,16 @@ class StateLoader:
             score = match_data.get("score", [1, 0])
 
             # Find the match in our schedule
-            key = tuple(sorted([team_a.id, team_b.id]))
-            match = match_lookup.get(key)
+            idx = match_grid[rows[team_a.id], rows[team_b.id]]
 
-            if match:
+            if idx >= 0:
                 result = MatchResult(
                     winner=winner,
                     loser=loser,
                     winner_score=score[0],
                     loser_score=score[1],
                 )
-                tournament.record_round_robin_result(match, result)
+                record(schedule[idx], result)
 
         return tournament
 
@@ -1,9 +1,8 @@
 """Match and MatchResult models."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
-from uuid import UUID, uuid4
 
 from lec_sim.models.team import Team
 
@@ -15,13 +14,14 @@ class MatchFormat(Enum):
     BO3 = 3
     BO5 = 5
 
-    @property
-    def games_to_win(self) -> int:
-        """Number of games needed to win the series."""
-        return (self.value + 1) // 2
+    games_to_win: int  # Number of games needed to win the series
+
+    def __init__(self, best_of: int) -> None:
+        # Plain attribute on each member, so lookups skip a property call
+        self.games_to_win = (best_of + 1) // 2
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Result of a completed match."""
 
@@ -36,18 +36,19 @@ class MatchResult:
         return self.loser_score == 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """Represents a scheduled or completed match."""
 
-    team_a: Team
-    team_b: Team
+    # None only for a playoff slot whose team is not decided yet
+    team_a: Optional[Team]
+    team_b: Optional[Team]
     format: MatchFormat = MatchFormat.BO1
     stage: str = "round_robin"  # "round_robin", "upper_r1", "lower_final", etc.
     week: Optional[int] = None
     match_day: Optional[int] = None
     result: Optional[MatchResult] = None
-    id: UUID = field(default_factory=uuid4)
+    id: int = 0  # Index in the round-robin schedule, or the playoff bracket position
 
     @property
     def is_completed(self) -> bool:
@@ -63,6 +64,8 @@ class Match:
         raise ValueError(f"{team} is not in this match")
 
     def __repr__(self) -> str:
+        team_a = self.team_a.short_name if self.team_a else "TBD"
+        team_b = self.team_b.short_name if self.team_b else "TBD"
         if self.result:
-            return f"Match({self.team_a.short_name} vs {self.team_b.short_name}: {self.result.winner.short_name} wins)"
-        return f"Match({self.team_a.short_name} vs {self.team_b.short_name})"
+            return f"Match({team_a} vs {team_b}: {self.result.winner.short_name} wins)"
+        return f"Match({team_a} vs {team_b})"
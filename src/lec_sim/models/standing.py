@@ -1,21 +1,45 @@
 """Standing models for tracking team records."""
 
-from dataclasses import dataclass, field
-from typing import Optional
-from uuid import UUID
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+import numpy as np
 
 from lec_sim.models.team import Team
 
 
-@dataclass
+@dataclass(eq=False, slots=True)
 class TeamStanding:
-    """Standing for a single team."""
+    """
+    Standing for a single team.
+
+    A lightweight view onto one row of a Standings table: reads and writes
+    go straight through to the table's arrays.
+    """
 
     team: Team
-    wins: int = 0
-    losses: int = 0
-    # head_to_head: opponent_id -> (wins against them, losses against them)
-    head_to_head: dict[UUID, tuple[int, int]] = field(default_factory=dict)
+    index: int  # Row of this team in the owning table's arrays
+    table: "Standings"
+
+    @property
+    def wins(self) -> int:
+        """Total wins."""
+        return int(self.table.wins[self.index])
+
+    @property
+    def losses(self) -> int:
+        """Total losses."""
+        return int(self.table.losses[self.index])
+
+    @property
+    def head_to_head(self) -> dict[int, tuple[int, int]]:
+        """opponent_id -> (wins against them, losses against them), for opponents played."""
+        row = self.table.h2h[self.index]
+        teams = self.table.teams
+        return {
+            teams[j].id: (int(row[j, 0]), int(row[j, 1]))
+            for j in np.flatnonzero(row.any(axis=1))
+        }
 
     @property
     def games_played(self) -> int:
@@ -29,42 +53,64 @@ class TeamStanding:
             return 0.0
         return self.wins / self.games_played
 
-    def record_win(self, opponent_id: UUID) -> None:
+    def record_win(self, opponent_id: int) -> None:
         """Record a win against an opponent."""
-        self.wins += 1
-        w, l = self.head_to_head.get(opponent_id, (0, 0))
-        self.head_to_head[opponent_id] = (w + 1, l)
+        self.table.wins[self.index] += 1
+        self.table.h2h[self.index, self.table.team_index[opponent_id], 0] += 1
 
-    def record_loss(self, opponent_id: UUID) -> None:
+    def record_loss(self, opponent_id: int) -> None:
         """Record a loss against an opponent."""
-        self.losses += 1
-        w, l = self.head_to_head.get(opponent_id, (0, 0))
-        self.head_to_head[opponent_id] = (w, l + 1)
+        self.table.losses[self.index] += 1
+        self.table.h2h[self.index, self.table.team_index[opponent_id], 1] += 1
 
-    def get_h2h_record(self, opponent_id: UUID) -> tuple[int, int]:
+    def get_h2h_record(self, opponent_id: int) -> tuple[int, int]:
         """Get head-to-head record against an opponent."""
-        return self.head_to_head.get(opponent_id, (0, 0))
-
-    def copy(self) -> "TeamStanding":
-        """Create a deep copy of this standing."""
-        return TeamStanding(
-            team=self.team,
-            wins=self.wins,
-            losses=self.losses,
-            head_to_head=dict(self.head_to_head),
-        )
+        j = self.table.team_index.get(opponent_id)
+        if j is None:
+            return (0, 0)
+        wins, losses = self.table.h2h[self.index, j]
+        return (int(wins), int(losses))
 
     def __repr__(self) -> str:
         return f"Standing({self.team.short_name}: {self.wins}-{self.losses})"
 
 
-@dataclass
 class Standings:
-    """Collection of all team standings."""
-
-    standings: dict[UUID, TeamStanding] = field(default_factory=dict)
-
-    def get(self, team_id: UUID) -> Optional[TeamStanding]:
+    """
+    Collection of all team standings.
+
+    Records are stored as parallel arrays indexed by each team's row in
+    `teams`:
+
+    - wins[i], losses[i]: overall record of team i
+    - h2h[i, j] = (wins of i against j, losses of i against j)
+
+    TeamStanding views over these rows back the dict-style API.
+    """
+
+    __slots__ = ("_rows", "h2h", "losses", "standings", "team_index", "teams", "wins")
+
+    def __init__(self, teams: Iterable[Team] = ()):
+        self.teams: list[Team] = list(teams)
+        self.team_index: dict[int, int] = {t.id: i for i, t in enumerate(self.teams)}
+        n = len(self.teams)
+        self.wins = np.zeros(n, dtype=np.int16)
+        self.losses = np.zeros(n, dtype=np.int16)
+        self.h2h = np.zeros((n, n, 2), dtype=np.int16)
+        self._bind_rows()
+
+    def _bind_rows(self) -> None:
+        """(Re)build the per-team views over the arrays."""
+        self._rows = [
+            TeamStanding(team=team, index=i, table=self)
+            for i, team in enumerate(self.teams)
+        ]
+        # team_id -> view
+        self.standings: dict[int, TeamStanding] = {
+            s.team.id: s for s in self._rows
+        }
+
+    def get(self, team_id: int) -> Optional[TeamStanding]:
         """Get standing for a team by ID."""
         return self.standings.get(team_id)
 
@@ -74,38 +120,57 @@ class Standings:
 
     def add_team(self, team: Team) -> TeamStanding:
         """Add a team to standings (creates empty record)."""
-        standing = TeamStanding(team=team)
+        index = len(self.teams)
+        self.teams.append(team)
+        self.team_index[team.id] = index
+        self.wins = np.pad(self.wins, (0, 1))
+        self.losses = np.pad(self.losses, (0, 1))
+        self.h2h = np.pad(self.h2h, ((0, 1), (0, 1), (0, 0)))
+
+        standing = TeamStanding(team=team, index=index, table=self)
+        self._rows.append(standing)
         self.standings[team.id] = standing
         return standing
 
     def record_match_result(self, winner: Team, loser: Team) -> None:
         """Record a match result in standings."""
-        winner_standing = self.standings.get(winner.id)
-        loser_standing = self.standings.get(loser.id)
+        winner_row = self.team_index.get(winner.id)
+        loser_row = self.team_index.get(loser.id)
 
-        if winner_standing is None or loser_standing is None:
+        if winner_row is None or loser_row is None:
             raise ValueError("Both teams must be in standings")
 
-        winner_standing.record_win(loser.id)
-        loser_standing.record_loss(winner.id)
+        self.wins[winner_row] += 1
+        self.losses[loser_row] += 1
+        self.h2h[winner_row, loser_row, 0] += 1
+        self.h2h[loser_row, winner_row, 1] += 1
+
+    def get_order(self) -> np.ndarray:
+        """Return the row permutation ordering teams by wins (desc), then losses (asc)."""
+        return np.lexsort((self.losses, -self.wins))
 
     def get_ordered(self) -> list[TeamStanding]:
         """Return standings ordered by wins (desc), then losses (asc)."""
-        return sorted(
-            self.standings.values(),
-            key=lambda s: (-s.wins, s.losses),
-        )
+        return [self._rows[i] for i in self.get_order()]
 
     def get_teams_with_wins(self, wins: int) -> list[TeamStanding]:
         """Get all teams with exactly N wins."""
-        return [s for s in self.standings.values() if s.wins == wins]
+        return [self._rows[i] for i in np.flatnonzero(self.wins == wins)]
+
+    def snapshot(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Capture the current records as (wins, losses, h2h) array copies."""
+        return (self.wins.copy(), self.losses.copy(), self.h2h.copy())
 
     def copy(self) -> "Standings":
         """Create a deep copy of standings."""
-        new_standings = Standings()
-        for team_id, standing in self.standings.items():
-            new_standings.standings[team_id] = standing.copy()
+        new_standings = Standings.__new__(Standings)
+        new_standings.teams = list(self.teams)  # Teams are immutable, can share
+        new_standings.team_index = dict(self.team_index)
+        new_standings.wins = self.wins.copy()
+        new_standings.losses = self.losses.copy()
+        new_standings.h2h = self.h2h.copy()
+        new_standings._bind_rows()
         return new_standings
 
     def __len__(self) -> int:
-        return len(self.standings)
+        return len(self.teams)
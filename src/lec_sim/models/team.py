@@ -1,20 +1,36 @@
 """Team model."""
 
 from dataclasses import dataclass, field
-from uuid import UUID, uuid4
 
+# Next auto-assigned team ID. Teams compare by ID alone, so this is kept above
+# every ID handed out or passed in explicitly: IDs never repeat in a process.
+_next_team_id = 0
 
-@dataclass
+
+def _next_id() -> int:
+    """Allocate the next auto-assigned team ID."""
+    global _next_team_id
+    team_id = _next_team_id
+    _next_team_id += 1
+    return team_id
+
+
+@dataclass(slots=True)
 class Team:
     """Represents a team in the tournament."""
 
     name: str
     short_name: str  # e.g., "FNC", "G2"
-    id: UUID = field(default_factory=uuid4)
+    id: int = field(default_factory=_next_id)
     is_erl: bool = False  # True for Los Ratones, Karmine Corp Blue
 
+    def __post_init__(self) -> None:
+        # Keep later auto-assigned IDs clear of an explicit one
+        global _next_team_id
+        _next_team_id = max(_next_team_id, self.id + 1)
+
     def __hash__(self) -> int:
-        return hash(self.id)
+        return self.id
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Team):
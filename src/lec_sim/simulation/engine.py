@@ -1,27 +1,97 @@
 """Monte Carlo simulation engine."""
 
-from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Final, Optional
+import heapq
+import multiprocessing
+import os
 import random
 
+import numpy as np
+
 from lec_sim.models.team import Team
-from lec_sim.models.match import Match, MatchFormat, MatchResult
-from lec_sim.models.standing import TeamStanding
+from lec_sim.models.match import Match, MatchResult
+from lec_sim.models.standing import Standings, TeamStanding
+from lec_sim.fixed_point import FIXED_POINT_ONE, to_fixed_point
 from lec_sim.simulation.win_rates import WinRateMatrix
+from lec_sim.tiebreaker.resolver import resolve_order, resolve_orders
 from lec_sim.tournament.tournament import Tournament
-from lec_sim.tournament.playoffs import PlayoffBracket, BracketPosition
-
-
-@dataclass
+from lec_sim.tournament.playoffs import (
+    MAX_SERIES_GAMES,
+    NUM_POSITIONS,
+    BracketPosition,
+    PlayoffBracket,
+    simulate_brackets,
+)
+
+# Simulations per chunk. Each chunk draws from its own child of the configured
+# seed and plays its round-robin matches in one vectorized pass. Seeds follow
+# chunks rather than workers, so results do not depend on the worker count.
+_CHUNK_SIZE = 2048
+
+# Order in which playoff matches are played
+_PLAYOFF_ORDER: Final[tuple[BracketPosition, ...]] = (
+    # Upper QFs
+    BracketPosition.UPPER_QF_1,
+    BracketPosition.UPPER_QF_2,
+    BracketPosition.UPPER_QF_3,
+    BracketPosition.UPPER_QF_4,
+    # Lower R1 (losers from QFs)
+    BracketPosition.LOWER_R1_1,
+    BracketPosition.LOWER_R1_2,
+    # Upper SFs
+    BracketPosition.UPPER_SF_1,
+    BracketPosition.UPPER_SF_2,
+    # Lower R2
+    BracketPosition.LOWER_R2_1,
+    BracketPosition.LOWER_R2_2,
+    # Upper Final
+    BracketPosition.UPPER_FINAL,
+    # Lower SF
+    BracketPosition.LOWER_SF,
+    # Lower Final
+    BracketPosition.LOWER_FINAL,
+    # Grand Final
+    BracketPosition.GRAND_FINAL,
+)
+
+
+@dataclass(slots=True)
 class SimulationConfig:
     """Configuration for Monte Carlo simulation."""
 
     num_simulations: int = 10000
     seed: Optional[int] = None
+    num_workers: int = 1  # Worker processes; 0 = one per CPU core
 
 
-@dataclass
+@dataclass(slots=True)
+class SimulationState:
+    """
+    Regular season records of one simulation, by standings row.
+
+    The only state that changes between simulations, held as plain arrays
+    instead of a copy of the tournament.
+    """
+
+    wins: np.ndarray  # (N,)
+    losses: np.ndarray  # (N,)
+    h2h: np.ndarray  # (N, N, 2): h2h[i, j] = (wins of i vs j, losses of i vs j)
+
+    @classmethod
+    def from_standings(cls, standings: Standings) -> "SimulationState":
+        """Capture a copy of a standings table's records."""
+        return cls(*standings.snapshot())
+
+    def record(self, winner: int, loser: int) -> None:
+        """Record a match result by standings row."""
+        self.wins[winner] += 1
+        self.losses[loser] += 1
+        self.h2h[winner, loser, 0] += 1
+        self.h2h[loser, winner, 1] += 1
+
+
+@dataclass(slots=True)
 class SimulationOutcome:
     """Outcome of a single tournament simulation."""
 
@@ -41,7 +111,7 @@ class SimulationOutcome:
     champion: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SimulationResults:
     """Aggregated results from all simulations."""
 
@@ -92,10 +162,11 @@ class SimulationResults:
         print("CHAMPIONSHIP PROBABILITY")
         print("-" * 60)
         print(f"{'Rank':<6} {'Team':<25} {'Prob':<10}")
-        sorted_champs = sorted(
-            self.championship_probability.items(), key=lambda x: -x[1]
+        # Only the top 8 are shown, so skip sorting the rest
+        sorted_champs = heapq.nlargest(
+            8, self.championship_probability.items(), key=lambda x: x[1]
         )
-        for i, (team, prob) in enumerate(sorted_champs[:8], 1):
+        for i, (team, prob) in enumerate(sorted_champs, 1):
             print(f"{i:<6} {team:<25} {prob*100:>6.1f}%")
 
     def to_dict(self) -> dict:
@@ -110,6 +181,133 @@ class SimulationResults:
         }
 
 
+def _count_positions(rows: np.ndarray, num_teams: int, width: int) -> np.ndarray:
+    """
+    Count how often each team sits at each position.
+
+    Args:
+        rows: Team rows by position (column k = position k + 1), shape (S, K)
+        num_teams: Number of teams (rows of the result)
+        width: Columns of the result; position 0 is left unused
+
+    Returns:
+        counts[row, position], shape (num_teams, width)
+    """
+    flat = rows * width + np.arange(1, rows.shape[1] + 1)
+    return np.bincount(flat.ravel(), minlength=num_teams * width).reshape(
+        num_teams, width
+    )
+
+
+@dataclass
+class _OutcomeCounts:
+    """
+    Occurrence counts over a set of simulations; mergeable across workers.
+
+    Counts are (team row, position) arrays: regular_season[row, rank],
+    seeding[row, seed] and playoff_placement[row, place], with position 0
+    unused.
+    """
+
+    team_names: list[str]  # By standings row
+    num_simulations: int = 0
+    regular_season: np.ndarray = field(init=False)
+    seeding: np.ndarray = field(init=False)
+    playoff_placement: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        n = len(self.team_names)
+        self.regular_season = np.zeros((n, n + 1), dtype=np.int64)
+        self.seeding = np.zeros((n, 9), dtype=np.int64)
+        self.playoff_placement = np.zeros((n, 9), dtype=np.int64)
+
+    def add(self, orders: np.ndarray, placed: np.ndarray) -> None:
+        """
+        Count a batch of simulation outcomes.
+
+        Args:
+            orders: Team rows from 1st to last in each simulation's regular
+                season, shape (S, N)
+            placed: Team rows from 1st to 8th in each simulation's playoffs,
+                shape (S, 8)
+        """
+        n = len(self.team_names)
+        self.num_simulations += len(orders)
+        self.regular_season += _count_positions(orders, n, n + 1)
+        self.seeding += _count_positions(orders[:, :8], n, 9)
+        self.playoff_placement += _count_positions(placed, n, 9)
+
+    def merge(self, other: "_OutcomeCounts") -> None:
+        """Add another set of counts into this one."""
+        self.num_simulations += other.num_simulations
+        self.regular_season += other.regular_season
+        self.seeding += other.seeding
+        self.playoff_placement += other.playoff_placement
+
+    def to_results(self) -> SimulationResults:
+        """
+        Convert counts to probabilities.
+
+        Teams are keyed by name in sorted order; like positions, teams that
+        never reach a position (or the playoffs) are left out.
+        """
+        n = self.num_simulations
+        names = self.team_names
+        by_name = sorted(range(len(names)), key=names.__getitem__)
+
+        def probabilities(counts: np.ndarray) -> dict[str, float]:
+            counts = counts.tolist()
+            return {names[i]: counts[i] / n for i in by_name if counts[i]}
+
+        def distribution(counts: np.ndarray) -> dict[str, dict[int, float]]:
+            counts = counts.tolist()
+            return {
+                names[i]: {k: c / n for k, c in enumerate(counts[i]) if c}
+                for i in by_name
+                if any(counts[i])
+            }
+
+        return SimulationResults(
+            num_simulations=n,
+            playoff_probability=probabilities(self.seeding.sum(axis=1)),
+            championship_probability=probabilities(self.playoff_placement[:, 1]),
+            regular_season_distribution=distribution(self.regular_season),
+            seeding_distribution=distribution(self.seeding),
+            playoff_placement_distribution=distribution(self.playoff_placement),
+        )
+
+
+def _play_series(
+    prob_a_wins: float, games_to_win: int, rng: random.Random
+) -> tuple[int, int]:
+    """Play a series game by game; return (team_a games, team_b games)."""
+    a_score, b_score = 0, 0
+    while a_score < games_to_win and b_score < games_to_win:
+        if rng.random() < prob_a_wins:
+            a_score += 1
+        else:
+            b_score += 1
+    return a_score, b_score
+
+
+# Engine of a pool worker process, built once by _init_worker
+_worker_engine: Optional["SimulationEngine"] = None
+
+
+def _init_worker(
+    tournament: Tournament, win_rates: WinRateMatrix, remaining: list[Match]
+) -> None:
+    """Build the worker's engine once, so tasks only carry a count and a seed."""
+    global _worker_engine
+    _worker_engine = SimulationEngine(tournament, win_rates, remaining=remaining)
+
+
+def _run_chunk(task: tuple[int, np.random.SeedSequence]) -> _OutcomeCounts:
+    """Run one chunk of simulations in a worker process."""
+    num_simulations, seed_seq = task
+    return _worker_engine._run_counts(num_simulations, seed_seq)
+
+
 class SimulationEngine:
     """Monte Carlo simulation engine for tournament outcomes."""
 
@@ -118,33 +316,41 @@ class SimulationEngine:
         tournament: Tournament,
         win_rates: WinRateMatrix,
         config: Optional[SimulationConfig] = None,
+        remaining: Optional[list[Match]] = None,
     ):
+        """
+        Initialize the simulation engine.
+
+        Args:
+            tournament: Tournament state to simulate forward from
+            win_rates: Match win probabilities
+            config: Simulation settings
+            remaining: The tournament's unplayed round-robin matches, if the
+                caller already has them; computed from the tournament otherwise
+        """
         self.tournament = tournament
         self.win_rates = win_rates
         self.config = config or SimulationConfig()
-        self._rng = random.Random(self.config.seed)
+        if remaining is None:
+            remaining = tournament.get_remaining_round_robin_matches()
+        self.remaining = remaining
 
-    def simulate_match(self, match: Match, rng: random.Random) -> MatchResult:
-        """Simulate a single match outcome."""
-        prob_a_wins = self.win_rates.get_win_probability(
-            match.team_a.id, match.team_b.id
-        )
+        # Private dense probabilities in standings row order, so rows index
+        # them directly; the caller's matrix is left as it is
+        self._probs = win_rates.dense(t.id for t in tournament.standings.teams)
+        self._probs_fixed = to_fixed_point(self._probs)
 
-        if match.format == MatchFormat.BO1:
-            a_wins = rng.random() < prob_a_wins
-            winner = match.team_a if a_wins else match.team_b
-            loser = match.team_b if a_wins else match.team_a
-            return MatchResult(winner=winner, loser=loser, winner_score=1, loser_score=0)
+        # The remaining matches and their probabilities are the same in every
+        # simulation, so pack them once
+        self._packed = tournament.pack_remaining(self._probs_fixed, remaining)
 
-        # Bo3/Bo5: simulate individual games
-        games_to_win = match.format.games_to_win
-        a_score, b_score = 0, 0
+        self._team_names = [t.name for t in tournament.standings.teams]
 
-        while a_score < games_to_win and b_score < games_to_win:
-            if rng.random() < prob_a_wins:
-                a_score += 1
-            else:
-                b_score += 1
+    def simulate_match(self, match: Match, rng: random.Random) -> MatchResult:
+        """Simulate a single match outcome."""
+        index = self.tournament.standings.team_index
+        prob_a_wins = float(self._probs[index[match.team_a.id], index[match.team_b.id]])
+        a_score, b_score = _play_series(prob_a_wins, match.format.games_to_win, rng)
 
         if a_score > b_score:
             return MatchResult(
@@ -166,150 +372,175 @@ class SimulationEngine:
     ) -> PlayoffBracket:
         """Simulate the entire playoff bracket."""
         # Process matches in order
-        match_order = [
-            # Upper QFs
-            BracketPosition.UPPER_QF_1,
-            BracketPosition.UPPER_QF_2,
-            BracketPosition.UPPER_QF_3,
-            BracketPosition.UPPER_QF_4,
-            # Lower R1 (losers from QFs)
-            BracketPosition.LOWER_R1_1,
-            BracketPosition.LOWER_R1_2,
-            # Upper SFs
-            BracketPosition.UPPER_SF_1,
-            BracketPosition.UPPER_SF_2,
-            # Lower R2
-            BracketPosition.LOWER_R2_1,
-            BracketPosition.LOWER_R2_2,
-            # Upper Final
-            BracketPosition.UPPER_FINAL,
-            # Lower SF
-            BracketPosition.LOWER_SF,
-            # Lower Final
-            BracketPosition.LOWER_FINAL,
-            # Grand Final
-            BracketPosition.GRAND_FINAL,
-        ]
-
-        for position in match_order:
-            if position in bracket.matches and position not in bracket.results:
-                match = bracket.matches[position]
-                # Make sure both teams are set (not placeholder)
-                if match.team_a != match.team_b:
-                    result = self.simulate_match(match, rng)
-                    bracket.record_result(position, result)
+        for position in _PLAYOFF_ORDER:
+            match = bracket.matches[position]
+            # Unplayed, with both teams set
+            if (
+                match is not None
+                and bracket.results[position] is None
+                and match.team_a is not None
+                and match.team_b is not None
+            ):
+                result = self.simulate_match(match, rng)
+                bracket.record_result(position, result)
 
         return bracket
 
-    def run_single_simulation(self, seed: int) -> SimulationOutcome:
-        """Run a single tournament simulation."""
-        rng = random.Random(seed)
-        tournament_copy = self.tournament.copy()
-
-        # Simulate remaining round-robin matches
-        for match in tournament_copy.get_remaining_round_robin_matches():
-            result = self.simulate_match(match, rng)
-            tournament_copy.record_round_robin_result(match, result)
-
-        # Resolve tiebreakers and determine playoff seeding
-        final_standings = tournament_copy.resolve_standings(rng)
-
+    def simulate_round_robin_batch(
+        self, num_simulations: int, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Play the remaining round-robin matches on top of the current
+        standings, many times (see Tournament.simulate_remaining).
+
+        Returns final (wins, losses, h2h) standings arrays with a leading
+        num_simulations axis.
+        """
+        return self.tournament.simulate_remaining(self._packed, num_simulations, rng)
+
+    def run_single_simulation(
+        self, seed: int, state: Optional[SimulationState] = None
+    ) -> SimulationOutcome:
+        """
+        Run a single tournament simulation.
+
+        Args:
+            seed: Seed for this simulation's random stream
+            state: Final regular season records, with the remaining round-robin
+                matches already played. If None, remaining matches are
+                simulated one by one on a copy of the current records.
+        """
+        final_order, placed = self._simulate_rows(seed, state)
+        names = self._team_names
         outcome = SimulationOutcome()
 
         # Record regular season ranks
-        for rank, standing in enumerate(final_standings, 1):
-            outcome.regular_season_rank[standing.team.name] = rank
+        for rank, row in enumerate(final_order, 1):
+            outcome.regular_season_rank[names[row]] = rank
 
         # Top 8 make playoffs
-        playoff_teams = final_standings[:8]
-        for seed, standing in enumerate(playoff_teams, 1):
-            outcome.made_playoffs.add(standing.team.name)
-            outcome.playoff_seed[standing.team.name] = seed
-
-        # Simulate playoffs
-        bracket = tournament_copy.create_playoff_bracket(playoff_teams)
-        bracket = self.simulate_playoffs(bracket, rng)
+        for playoff_seed, row in enumerate(final_order[:8], 1):
+            outcome.made_playoffs.add(names[row])
+            outcome.playoff_seed[names[row]] = playoff_seed
 
         # Record final placements
-        if bracket.champion:
-            outcome.champion = bracket.champion.name
-            outcome.final_placement[bracket.champion.name] = 1
-        if bracket.runner_up:
-            outcome.final_placement[bracket.runner_up.name] = 2
-        if bracket.third_place:
-            outcome.final_placement[bracket.third_place.name] = 3
-        if bracket.fourth_place:
-            outcome.final_placement[bracket.fourth_place.name] = 4
-
-        # 5th-8th for teams eliminated in lower R2
-        placement = 5
-        for team in bracket.eliminated:
-            if team.name not in outcome.final_placement:
-                outcome.final_placement[team.name] = placement
-                placement += 1
+        outcome.champion = names[placed[0]]
+        for place, row in enumerate(placed, 1):
+            outcome.final_placement[names[row]] = place
 
         return outcome
 
-    def run(self) -> SimulationResults:
-        """Run all Monte Carlo simulations."""
-        # Generate seeds for reproducibility
-        seeds = [self._rng.randint(0, 2**31) for _ in range(self.config.num_simulations)]
+    def _simulate_rows(
+        self, seed: int, state: Optional[SimulationState] = None
+    ) -> tuple[list[int], list[int]]:
+        """
+        Run a single simulation, in standings rows.
 
-        outcomes = [self.run_single_simulation(s) for s in seeds]
+        Returns the regular season order (1st to last) and the playoff
+        placement order (1st to 8th). See run_single_simulation for the args.
+        """
+        rng = random.Random(seed)
+        if state is None:
+            # Play straight into the state arrays, without MatchResult objects
+            state = SimulationState.from_standings(self.tournament.standings)
+            index = self.tournament.standings.team_index
+            probs = self._probs
+            for match in self.remaining:
+                a, b = index[match.team_a.id], index[match.team_b.id]
+                a_games, b_games = _play_series(
+                    float(probs[a, b]), match.format.games_to_win, rng
+                )
+                state.record(*((a, b) if a_games > b_games else (b, a)))
+
+        # Resolve tiebreakers and determine playoff seeding; top 8 make playoffs
+        final_order = resolve_order(state.wins, state.h2h, rng)
+        playoff_rows = final_order[:8]
 
-        return self._aggregate_results(outcomes)
+        # Simulate playoffs
+        standings = self.tournament.standings
+        bracket = PlayoffBracket()
+        bracket.seed_teams([standings.teams[row] for row in playoff_rows])
+        bracket = self.simulate_playoffs(bracket, rng)
+        placed_teams = [
+            bracket.champion,
+            bracket.runner_up,
+            bracket.third_place,
+            bracket.fourth_place,
+            # 5th-8th: lower R2 losers, then lower R1 losers
+            *(
+                bracket.results[position].loser
+                for position in (
+                    BracketPosition.LOWER_R2_1,
+                    BracketPosition.LOWER_R2_2,
+                    BracketPosition.LOWER_R1_1,
+                    BracketPosition.LOWER_R1_2,
+                )
+            ),
+        ]
+        placed = [standings.team_index[team.id] for team in placed_teams]
 
-    def _aggregate_results(self, outcomes: list[SimulationOutcome]) -> SimulationResults:
-        """Aggregate individual simulation outcomes into summary statistics."""
-        n = len(outcomes)
+        return final_order, placed
 
-        # Count occurrences
-        playoff_counts: dict[str, int] = defaultdict(int)
-        championship_counts: dict[str, int] = defaultdict(int)
-        regular_season_counts: dict[str, dict[int, int]] = defaultdict(
-            lambda: defaultdict(int)
+    def run(self) -> SimulationResults:
+        """
+        Run all Monte Carlo simulations.
+
+        Simulations are split into fixed-size chunks, each seeded by its own
+        child of the configured seed (independent PCG64 streams). With more
+        than one worker, chunks run on a spawn-context process pool. Results
+        are reproducible for a given seed, whatever the worker count.
+        """
+        n = self.config.num_simulations
+        root_seed = np.random.SeedSequence(self.config.seed)
+        sizes = [min(_CHUNK_SIZE, n - start) for start in range(0, n, _CHUNK_SIZE)]
+        tasks = list(zip(sizes, root_seed.spawn(len(sizes))))
+
+        workers = self.config.num_workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(tasks)))
+
+        counts = _OutcomeCounts(self._team_names)
+        if workers == 1:
+            for num_simulations, seed_seq in tasks:
+                counts.merge(self._run_counts(num_simulations, seed_seq))
+            return counts.to_results()
+
+        # "spawn" behaves the same on every platform (and is the only option
+        # on Windows); the initializer ships the tournament once per worker
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(self.tournament, self.win_rates, self.remaining),
+        ) as pool:
+            # imap keeps chunk order, so counts merge exactly as in one process
+            for chunk_counts in pool.imap(_run_chunk, tasks):
+                counts.merge(chunk_counts)
+        return counts.to_results()
+
+    def _run_counts(
+        self, num_simulations: int, seed_seq: np.random.SeedSequence
+    ) -> _OutcomeCounts:
+        """Run one chunk of simulations in this process and count their outcomes."""
+        np_rng = np.random.Generator(np.random.PCG64(seed_seq))
+        wins, _, h2h = self.simulate_round_robin_batch(num_simulations, np_rng)
+
+        # Coinflips follow a random ranking of the rows in each simulation
+        num_teams = len(self._team_names)
+        coin_rank = np_rng.permuted(
+            np.tile(np.arange(num_teams), (num_simulations, 1)), axis=1
         )
-        seeding_counts: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
-        playoff_placement_counts: dict[str, dict[int, int]] = defaultdict(
-            lambda: defaultdict(int)
+        orders = resolve_orders(wins, h2h, coin_rank)
+
+        # Every playoff game, drawn up front like the round robin's, so the
+        # brackets come out the same with or without Numba
+        draws = np_rng.integers(
+            0,
+            FIXED_POINT_ONE,
+            size=(num_simulations, NUM_POSITIONS, MAX_SERIES_GAMES),
+            dtype=np.uint32,
         )
+        placed = simulate_brackets(orders[:, :8], self._probs_fixed, draws)
 
-        for outcome in outcomes:
-            # Playoff qualification
-            for team_name in outcome.made_playoffs:
-                playoff_counts[team_name] += 1
-
-            # Championship
-            if outcome.champion:
-                championship_counts[outcome.champion] += 1
-
-            # Regular season distribution
-            for team_name, rank in outcome.regular_season_rank.items():
-                regular_season_counts[team_name][rank] += 1
-
-            # Seeding distribution
-            for team_name, seed in outcome.playoff_seed.items():
-                seeding_counts[team_name][seed] += 1
-
-            # Playoff placement distribution
-            for team_name, placement in outcome.final_placement.items():
-                playoff_placement_counts[team_name][placement] += 1
-
-        # Convert to probabilities
-        return SimulationResults(
-            num_simulations=n,
-            playoff_probability={k: v / n for k, v in playoff_counts.items()},
-            championship_probability={k: v / n for k, v in championship_counts.items()},
-            regular_season_distribution={
-                team: {rank: count / n for rank, count in ranks.items()}
-                for team, ranks in regular_season_counts.items()
-            },
-            seeding_distribution={
-                team: {seed: count / n for seed, count in seeds.items()}
-                for team, seeds in seeding_counts.items()
-            },
-            playoff_placement_distribution={
-                team: {place: count / n for place, count in places.items()}
-                for team, places in playoff_placement_counts.items()
-            },
-        )
+        counts = _OutcomeCounts(self._team_names)
+        counts.add(orders, placed)
+        return counts
@@ -1,7 +1,11 @@
 """Win rate matrix for calculating match probabilities."""
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from uuid import UUID
+
+import numpy as np
+
+from lec_sim.fixed_point import to_fixed_point
 
 
 @dataclass
@@ -10,24 +14,94 @@ class WinRateMatrix:
     Stores win probabilities between teams.
 
     matrix[team_a_id][team_b_id] = P(team_a beats team_b)
+
+    After finalize(), the same probabilities are also held densely, as
+    float64 so set values read back exactly:
+    probs[team_index[a], team_index[b]] = P(a beats b), with unset pairs at
+    default_rate, and probs_fixed holds the same values as uint32 fixed-point
+    thresholds (see lec_sim.fixed_point).
     """
 
-    matrix: dict[UUID, dict[UUID, float]] = field(default_factory=dict)
+    matrix: dict[int, dict[int, float]] = field(default_factory=dict)
     default_rate: float = 0.5
+    # Derived from matrix by finalize(), so left out of comparisons
+    team_index: dict[int, int] = field(
+        default_factory=dict, init=False, compare=False, repr=False
+    )
+    probs: np.ndarray | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+    probs_fixed: np.ndarray | None = field(
+        default=None, init=False, compare=False, repr=False
+    )
+
+    def finalize(self, team_ids: Iterable[int] | None = None) -> "WinRateMatrix":
+        """
+        Build the dense probs array once all probabilities are set.
+
+        Args:
+            team_ids: Teams to index, in row order. If None, uses every team
+                in the matrix, sorted by ID.
 
-    def get_win_probability(self, team_a_id: UUID, team_b_id: UUID) -> float:
+        Returns:
+            self, for chaining
+        """
+        if team_ids is None:
+            team_ids = sorted(self.matrix)
+        team_ids = list(team_ids)
+        probs = self.dense(team_ids)
+        self.team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+        self._set_dense(probs)
+        return self
+
+    def dense(self, team_ids: Iterable[int]) -> np.ndarray:
+        """
+        Build a dense float64 array for the given teams, leaving this matrix
+        untouched: out[i, j] = P(team_ids[i] beats team_ids[j]), with unset
+        pairs at default_rate.
+        """
+        team_ids = list(team_ids)
+        if self.probs is not None and list(self.team_index) == team_ids:
+            return self.probs.copy()
+
+        index = {team_id: i for i, team_id in enumerate(team_ids)}
+        n = len(index)
+        probs = np.full((n, n), self.default_rate, dtype=np.float64)
+        for team_a_id, row in self.matrix.items():
+            i = index.get(team_a_id)
+            if i is None:
+                continue
+            for team_b_id, prob in row.items():
+                j = index.get(team_b_id)
+                if j is not None:
+                    probs[i, j] = prob
+        return probs
+
+    def _set_dense(self, probs: np.ndarray) -> None:
+        """Store the dense array and its fixed-point thresholds."""
+        self.probs = np.asarray(probs, dtype=np.float64)
+        self.probs_fixed = to_fixed_point(self.probs)
+
+    def get_win_probability(self, team_a_id: int, team_b_id: int) -> float:
         """Get probability of team_a beating team_b."""
+        if self.probs is not None:
+            i = self.team_index.get(team_a_id)
+            j = self.team_index.get(team_b_id)
+            if i is not None and j is not None:
+                return float(self.probs[i, j])
+
         if team_a_id in self.matrix and team_b_id in self.matrix[team_a_id]:
             return self.matrix[team_a_id][team_b_id]
         return self.default_rate
 
     def set_win_probability(
-        self, team_a_id: UUID, team_b_id: UUID, prob: float
+        self, team_a_id: int, team_b_id: int, prob: float
     ) -> None:
         """
         Set probability of team_a beating team_b.
 
-        Automatically sets inverse for team_b vs team_a.
+        Automatically sets inverse for team_b vs team_a. Discards the dense
+        array; call finalize() again afterwards.
         """
         if not 0.0 <= prob <= 1.0:
             raise ValueError("Probability must be between 0 and 1")
@@ -39,6 +113,8 @@ class WinRateMatrix:
 
         self.matrix[team_a_id][team_b_id] = prob
         self.matrix[team_b_id][team_a_id] = 1.0 - prob
+        self.probs = None
+        self.probs_fixed = None
 
     @classmethod
     def uniform(cls, rate: float = 0.5) -> "WinRateMatrix":
@@ -47,7 +123,7 @@ class WinRateMatrix:
 
     @classmethod
     def from_elo_ratings(
-        cls, elo_ratings: dict[UUID, float], k: float = 400
+        cls, elo_ratings: dict[int, float], k: float = 400
     ) -> "WinRateMatrix":
         """
         Generate win rate matrix from Elo ratings.
@@ -58,14 +134,22 @@ class WinRateMatrix:
             elo_ratings: Mapping of team_id to Elo rating
             k: Elo scale factor (default 400)
         """
-        matrix = cls()
-        team_ids = list(elo_ratings.keys())
-
-        for i, team_a in enumerate(team_ids):
-            for team_b in team_ids[i + 1 :]:
-                elo_a = elo_ratings[team_a]
-                elo_b = elo_ratings[team_b]
-                prob_a = 1 / (1 + 10 ** ((elo_b - elo_a) / k))
-                matrix.set_win_probability(team_a, team_b, prob_a)
-
+        team_ids = list(elo_ratings)
+        elos = np.fromiter(elo_ratings.values(), dtype=np.float64, count=len(team_ids))
+        # probs[i, j] = P(team i beats team j), for all pairs at once
+        probs = 1.0 / (1.0 + 10.0 ** ((elos[None, :] - elos[:, None]) / k))
+
+        matrix = cls(
+            matrix={
+                team_a: {
+                    team_b: prob
+                    for team_b, prob in zip(team_ids, row)
+                    if team_b != team_a
+                }
+                for team_a, row in zip(team_ids, probs.tolist())
+            }
+        )
+        # Already dense, so skip rebuilding the array in finalize()
+        matrix.team_index = {team_id: i for i, team_id in enumerate(team_ids)}
+        matrix._set_dense(probs)
         return matrix
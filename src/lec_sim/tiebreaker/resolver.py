@@ -3,9 +3,13 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum, auto
+from itertools import groupby, pairwise
+from operator import itemgetter
 from typing import Optional
 import random
 
+import numpy as np
+
 from lec_sim.models.standing import TeamStanding, Standings
 
 
@@ -17,7 +21,7 @@ class TiebreakerMethod(Enum):
     COINFLIP = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class TiebreakerResult:
     """Result of applying a tiebreaker."""
 
@@ -25,6 +29,9 @@ class TiebreakerResult:
     method_used: Optional[TiebreakerMethod]
     ordered_teams: list[TeamStanding]
     notes: str = ""
+    # Score of each team in ordered_teams (descending); teams sharing a score
+    # are still tied after this rule
+    scores: Optional[list[int]] = None
 
 
 class TiebreakerRule(ABC):
@@ -67,7 +74,9 @@ class HeadToHeadTiebreaker(TiebreakerRule):
                 True, TiebreakerMethod.HEAD_TO_HEAD, [t2, t1], "H2H wins"
             )
 
-        return TiebreakerResult(False, None, teams, "H2H tied")
+        return TiebreakerResult(
+            False, None, teams, "H2H tied", scores=[h2h_1[0], h2h_2[0]]
+        )
 
     def _resolve_multi_way(self, teams: list[TeamStanding]) -> TiebreakerResult:
         """
@@ -75,39 +84,28 @@ class HeadToHeadTiebreaker(TiebreakerRule):
 
         Teams are separated by their internal record (wins - losses among tied teams).
         """
-        # Calculate internal records (wins among tied teams only)
-        team_ids = {t.team.id for t in teams}
-        internal_records: dict[str, tuple[int, int, int]] = {}  # (wins, losses, diff)
-
-        for t in teams:
-            wins = sum(
-                t.get_h2h_record(other_id)[0]
-                for other_id in team_ids
-                if other_id != t.team.id
-            )
-            losses = sum(
-                t.get_h2h_record(other_id)[1]
-                for other_id in team_ids
-                if other_id != t.team.id
-            )
-            internal_records[str(t.team.id)] = (wins, losses, wins - losses)
+        # Internal win differential (wins - losses among tied teams only), in
+        # one pass over the tied block of the standings' H2H table
+        rows = [t.index for t in teams]
+        internal = teams[0].table.h2h[np.ix_(rows, rows)]
+        diffs = (internal[..., 0].sum(axis=1) - internal[..., 1].sum(axis=1)).tolist()
 
         # Sort by win differential
-        sorted_teams = sorted(
-            teams,
-            key=lambda t: internal_records[str(t.team.id)][2],
-            reverse=True,
-        )
+        order = sorted(range(len(teams)), key=diffs.__getitem__, reverse=True)
+        sorted_teams = [teams[i] for i in order]
 
         # Check if fully resolved (all different differentials)
-        diffs = [internal_records[str(t.team.id)][2] for t in sorted_teams]
         if len(set(diffs)) == len(diffs):
             return TiebreakerResult(
                 True, TiebreakerMethod.HEAD_TO_HEAD, sorted_teams, "Multi-way H2H"
             )
 
         return TiebreakerResult(
-            False, None, sorted_teams, "Multi-way H2H partially resolved"
+            False,
+            None,
+            sorted_teams,
+            "Multi-way H2H partially resolved",
+            scores=[diffs[i] for i in order],
         )
 
 
@@ -123,32 +121,24 @@ class StrengthOfVictoryTiebreaker(TiebreakerRule):
         tied_teams: list[TeamStanding],
         all_standings: Standings,
     ) -> TiebreakerResult:
-        sov_scores: dict[str, int] = {}
-
-        for team in tied_teams:
-            sov = 0
-            for opp_id, (wins_vs, _) in team.head_to_head.items():
-                if wins_vs > 0:  # We beat this opponent
-                    opp_standing = all_standings.get(opp_id)
-                    if opp_standing:
-                        # Add opponent's total wins * times we beat them
-                        sov += opp_standing.wins * wins_vs
-            sov_scores[str(team.team.id)] = sov
-
-        sorted_teams = sorted(
-            tied_teams,
-            key=lambda t: sov_scores[str(t.team.id)],
-            reverse=True,
-        )
+        # Each win adds the beaten opponent's total wins: one product of the
+        # tied rows of the H2H win table with the wins vector
+        rows = [t.index for t in tied_teams]
+        sov = (
+            all_standings.h2h[rows, :, 0].astype(np.int64) @ all_standings.wins
+        ).tolist()
+
+        order = sorted(range(len(tied_teams)), key=sov.__getitem__, reverse=True)
+        sorted_teams = [tied_teams[i] for i in order]
 
         # Check if resolved
-        scores = [sov_scores[str(t.team.id)] for t in sorted_teams]
+        scores = [sov[i] for i in order]
         if len(set(scores)) == len(scores):
             return TiebreakerResult(
                 True, TiebreakerMethod.STRENGTH_OF_VICTORY, sorted_teams, "SoV"
             )
 
-        return TiebreakerResult(False, None, sorted_teams, "SoV tied")
+        return TiebreakerResult(False, None, sorted_teams, "SoV tied", scores=scores)
 
 
 class CoinflipTiebreaker(TiebreakerRule):
@@ -193,14 +183,150 @@ class TiebreakerChain:
         """Apply tiebreakers until resolved."""
         if len(tied_teams) <= 1:
             return TiebreakerResult(True, None, tied_teams, "No tie")
+        return self._resolve(tied_teams, all_standings, self.rules)
 
+    def _resolve(
+        self,
+        tied_teams: list[TeamStanding],
+        all_standings: Standings,
+        rules: list[TiebreakerRule],
+    ) -> TiebreakerResult:
+        """Apply rules in order; split partial results by score and recurse."""
         current_teams = tied_teams
 
-        for rule in self.rules:
+        for i, rule in enumerate(rules):
             result = rule.resolve(current_teams, all_standings)
             if result.resolved:
                 return result
-            current_teams = result.ordered_teams
+            if result.scores is None:
+                current_teams = result.ordered_teams
+                continue
+
+            # Only teams still sharing a score go on to the next rules, so
+            # the order this rule did establish is kept
+            ordered: list[TeamStanding] = []
+            for _, group in groupby(
+                zip(result.scores, result.ordered_teams), key=itemgetter(0)
+            ):
+                sub_group = [team for _, team in group]
+                if len(sub_group) > 1:
+                    sub_group = self._resolve(
+                        sub_group, all_standings, rules[i + 1 :]
+                    ).ordered_teams
+                ordered.extend(sub_group)
+            return TiebreakerResult(True, None, ordered, f"{result.notes}, split")
 
         # Should never reach here if coinflip is last
         return TiebreakerResult(True, TiebreakerMethod.COINFLIP, current_teams)
+
+
+def resolve_order(
+    wins: np.ndarray, h2h: np.ndarray, rng: Optional[random.Random] = None
+) -> list[int]:
+    """
+    Order standings rows from 1st to last, resolving ties.
+
+    A pure-array version of grouping by wins and applying the default
+    TiebreakerChain (H2H -> SoV -> Coinflip) to each group: same order and,
+    for the same rng state, the same coinflips.
+
+    Args:
+        wins: Wins by standings row, shape (N,)
+        h2h: h2h[i, j] = (wins of i vs j, losses of i vs j), shape (N, N, 2)
+        rng: Random source for coinflips
+    """
+    # Common case: every win total is distinct, so there is nothing to break
+    ranked = np.sort(wins)
+    if np.all(ranked[1:] != ranked[:-1]):
+        return np.argsort(-wins, kind="stable").tolist()
+
+    order: list[int] = []
+    for w in np.unique(wins)[::-1]:
+        group = np.flatnonzero(wins == w)
+        if len(group) == 1:
+            order.append(int(group[0]))
+        else:
+            order.extend(_break_tie(group, wins, h2h, rng))
+    return order
+
+
+def resolve_orders(
+    wins: np.ndarray, h2h: np.ndarray, coin_rank: np.ndarray
+) -> np.ndarray:
+    """
+    Order standings rows from 1st to last for a batch of simulations.
+
+    Applies the default TiebreakerChain like resolve_order. H2H only splits
+    rows on equal wins, and SoV and the coinflip only rows still level after
+    it, so each order is one lexicographic sort by wins, H2H differential
+    within the win group (for two rows, the same order as direct wins) and
+    SoV. Coinflips follow coin_rank instead of an rng. The Numba kernel sorts
+    when available (simulations in parallel), else a vectorized NumPy lexsort;
+    both give the same orders.
+
+    Args:
+        wins: Wins by standings row, shape (S, N)
+        h2h: h2h[s, i, j] = (wins of i vs j, losses of i vs j), shape (S, N, N, 2)
+        coin_rank: Coinflip priority of each row, lower first; a random
+            permutation of the rows gives a fair coinflip, shape (S, N)
+
+    Returns:
+        Standings rows from 1st to last, shape (S, N)
+    """
+    # Imported here so that importing the tiebreakers does not load Numba
+    from lec_sim._kernels import HAVE_NUMBA, order_standings
+
+    if HAVE_NUMBA:
+        orders = np.empty(wins.shape, dtype=np.intp)
+        order_standings(wins, h2h, coin_rank, orders)
+        return orders
+
+    wins = wins.astype(np.int64)
+    won = h2h[..., 0].astype(np.int64)
+    same_wins = wins[:, :, None] == wins[:, None, :]
+    h2h_diff = ((won - h2h[..., 1]) * same_wins).sum(axis=2)
+    sov = (won @ wins[:, :, None])[..., 0]
+    return np.lexsort((coin_rank, -sov, -h2h_diff, -wins), axis=-1)
+
+
+def _break_tie(
+    group: np.ndarray,
+    wins: np.ndarray,
+    h2h: np.ndarray,
+    rng: Optional[random.Random],
+    rule: int = 0,
+) -> list[int]:
+    """
+    Order a group of tied rows, starting from a rule of the default chain.
+
+    Rules are 0: H2H, 1: SoV, 2: coinflip. After each scoring rule, only
+    rows still sharing a score go on to the next rule.
+    """
+    if rule == 2:
+        shuffled = group.tolist()
+        (rng or random.Random()).shuffle(shuffled)
+        return shuffled
+
+    if rule == 0 and len(group) == 2:
+        # Head-to-head: direct wins
+        a, b = group
+        scores = np.array([h2h[a, b, 0], h2h[b, a, 0]], dtype=np.int64)
+    elif rule == 0:
+        # Head-to-head: win differential among the tied rows
+        internal = h2h[np.ix_(group, group)].astype(np.int64)
+        scores = internal[..., 0].sum(axis=1) - internal[..., 1].sum(axis=1)
+    else:
+        # Strength of victory: opponent wins, weighted by wins against them
+        scores = h2h[group, :, 0].astype(np.int64) @ wins
+
+    by_score = np.argsort(-scores, kind="stable")
+    group, scores = group[by_score], scores[by_score]
+
+    order: list[int] = []
+    bounds = [0, *(np.flatnonzero(np.diff(scores)) + 1).tolist(), len(group)]
+    for start, end in pairwise(bounds):
+        if end - start == 1:
+            order.append(int(group[start]))
+        else:
+            order.extend(_break_tie(group[start:end], wins, h2h, rng, rule + 1))
+    return order
@@ -1,48 +1,151 @@
 """Double-elimination playoff bracket logic."""
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import IntEnum
 from typing import Optional
 
+import numpy as np
+
 from lec_sim.models.team import Team
 from lec_sim.models.match import Match, MatchFormat, MatchResult
 
 
-class BracketPosition(Enum):
-    """Positions in double-elimination bracket for 8 teams."""
+class BracketPosition(IntEnum):
+    """Positions in double-elimination bracket for 8 teams (indices 0-13)."""
 
     # Upper Bracket Round 1 (Quarterfinals)
-    UPPER_QF_1 = auto()  # Seed 1 vs Seed 8
-    UPPER_QF_2 = auto()  # Seed 4 vs Seed 5
-    UPPER_QF_3 = auto()  # Seed 2 vs Seed 7
-    UPPER_QF_4 = auto()  # Seed 3 vs Seed 6
+    UPPER_QF_1 = 0  # Seed 1 vs Seed 8
+    UPPER_QF_2 = 1  # Seed 4 vs Seed 5
+    UPPER_QF_3 = 2  # Seed 2 vs Seed 7
+    UPPER_QF_4 = 3  # Seed 3 vs Seed 6
 
     # Upper Bracket Round 2 (Semifinals)
-    UPPER_SF_1 = auto()  # Winner QF1 vs Winner QF2
-    UPPER_SF_2 = auto()  # Winner QF3 vs Winner QF4
+    UPPER_SF_1 = 4  # Winner QF1 vs Winner QF2
+    UPPER_SF_2 = 5  # Winner QF3 vs Winner QF4
 
     # Upper Bracket Final
-    UPPER_FINAL = auto()
+    UPPER_FINAL = 6
 
     # Lower Bracket Round 1
-    LOWER_R1_1 = auto()  # Loser QF1 vs Loser QF2
-    LOWER_R1_2 = auto()  # Loser QF3 vs Loser QF4
+    LOWER_R1_1 = 7  # Loser QF1 vs Loser QF2
+    LOWER_R1_2 = 8  # Loser QF3 vs Loser QF4
 
     # Lower Bracket Round 2
-    LOWER_R2_1 = auto()  # Winner LR1_1 vs Loser USF1
-    LOWER_R2_2 = auto()  # Winner LR1_2 vs Loser USF2
+    LOWER_R2_1 = 9  # Winner LR1_1 vs Loser USF1
+    LOWER_R2_2 = 10  # Winner LR1_2 vs Loser USF2
 
     # Lower Bracket Semifinal
-    LOWER_SF = auto()
+    LOWER_SF = 11
 
     # Lower Bracket Final
-    LOWER_FINAL = auto()
+    LOWER_FINAL = 12
 
     # Grand Final
-    GRAND_FINAL = auto()
+    GRAND_FINAL = 13
+
+
+NUM_POSITIONS = len(BracketPosition)
+
+# Lowercase position names, the Match.stage of matches created as the bracket
+# progresses ("upper_sf_1", "grand_final", ...)
+_STAGE_NAME: dict[BracketPosition, str] = {p: p.name.lower() for p in BracketPosition}
+
+# Format of the match at each position
+FORMATS: tuple[MatchFormat, ...] = (
+    *(MatchFormat.BO3,) * 4,  # Upper QFs
+    *(MatchFormat.BO3,) * 2,  # Upper SFs
+    MatchFormat.BO5,  # Upper Final
+    *(MatchFormat.BO3,) * 2,  # Lower R1
+    *(MatchFormat.BO3,) * 2,  # Lower R2
+    MatchFormat.BO5,  # Lower SF
+    MatchFormat.BO5,  # Lower Final
+    MatchFormat.BO5,  # Grand Final
+)
+
+# Where each result sends its teams, by position:
+# (winner_dest, winner_is_team_a, loser_dest, loser_is_team_a, loser_place)
+# Dests are BracketPositions, so they can be used directly as positions.
+# A dest of -1 means the team leaves the bracket: the winner as champion, the
+# loser eliminated, finishing at loser_place (2-8). Lower R2 losers take 5th
+# and 6th, lower R1 losers 7th and 8th.
+_P = BracketPosition
+TRANSITIONS: tuple[tuple[int, bool, int, bool, int], ...] = (
+    (_P.UPPER_SF_1, True, _P.LOWER_R1_1, True, 0),  # UPPER_QF_1
+    (_P.UPPER_SF_1, False, _P.LOWER_R1_1, False, 0),  # UPPER_QF_2
+    (_P.UPPER_SF_2, True, _P.LOWER_R1_2, True, 0),  # UPPER_QF_3
+    (_P.UPPER_SF_2, False, _P.LOWER_R1_2, False, 0),  # UPPER_QF_4
+    (_P.UPPER_FINAL, True, _P.LOWER_R2_1, False, 0),  # UPPER_SF_1
+    (_P.UPPER_FINAL, False, _P.LOWER_R2_2, False, 0),  # UPPER_SF_2
+    (_P.GRAND_FINAL, True, _P.LOWER_FINAL, False, 0),  # UPPER_FINAL
+    (_P.LOWER_R2_1, True, -1, False, 7),  # LOWER_R1_1
+    (_P.LOWER_R2_2, True, -1, False, 8),  # LOWER_R1_2
+    (_P.LOWER_SF, True, -1, False, 5),  # LOWER_R2_1
+    (_P.LOWER_SF, False, -1, False, 6),  # LOWER_R2_2
+    (_P.LOWER_FINAL, True, -1, False, 4),  # LOWER_SF
+    (_P.GRAND_FINAL, False, -1, False, 3),  # LOWER_FINAL
+    (-1, False, -1, False, 2),  # GRAND_FINAL
+)
+del _P
+
+# Seed indices (0-7) of team_a, team_b in each upper quarterfinal
+_QF_SEEDS = np.array([(0, 7), (3, 4), (1, 6), (2, 5)])
+
+# TRANSITIONS and games to win as arrays, for the batch simulator
+_TRANSITION_TABLE = np.array(TRANSITIONS, dtype=np.intp)
+_GAMES_TO_WIN = np.array([f.games_to_win for f in FORMATS], dtype=np.intp)
+
+# Game draws per series in simulate_brackets: enough for the longest format
+MAX_SERIES_GAMES = int(2 * _GAMES_TO_WIN.max() - 1)
+
+
+def _bracket_slots() -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten TRANSITIONS into the slot table of the Numba bracket kernel.
+
+    Slots 0-7 hold seeds 1-8, and the match at position k writes its winner
+    to slot 8 + 2k and its loser to slot 9 + 2k. Returns the
+    (team_a slot, team_b slot, games to win) of each position, and the
+    slots holding places 1-8.
+    """
+    bracket = np.empty((NUM_POSITIONS, 3), dtype=np.int64)
+    bracket[: len(_QF_SEEDS), :2] = _QF_SEEDS
+    bracket[:, 2] = _GAMES_TO_WIN
+    placement = np.empty(8, dtype=np.int64)
+    for position, (winner_dest, winner_is_a, loser_dest, loser_is_a, loser_place) in (
+        enumerate(TRANSITIONS)
+    ):
+        if winner_dest < 0:
+            placement[0] = 8 + 2 * position
+        else:
+            bracket[winner_dest, 1 - winner_is_a] = 8 + 2 * position
+        if loser_dest < 0:
+            placement[loser_place - 1] = 9 + 2 * position
+        else:
+            bracket[loser_dest, 1 - loser_is_a] = 9 + 2 * position
+    return bracket, placement
+
+
+# Position order is a valid play order, so the kernel plays row by row
+BRACKET_SLOTS, PLACEMENT_SLOTS = _bracket_slots()
+
 
+def _bracket_levels() -> tuple[np.ndarray, ...]:
+    """Group positions into levels whose matches only depend on earlier levels."""
+    # Position order is already a valid play order, so one pass suffices
+    depth = [0] * NUM_POSITIONS
+    for position, (winner_dest, _, loser_dest, _, _) in enumerate(TRANSITIONS):
+        for dest in (winner_dest, loser_dest):
+            if dest >= 0:
+                depth[dest] = max(depth[dest], depth[position] + 1)
+    return tuple(
+        np.flatnonzero(np.array(depth) == level) for level in range(max(depth) + 1)
+    )
 
-@dataclass
+
+_LEVELS = _bracket_levels()
+
+
+@dataclass(slots=True)
 class BracketSlot:
     """A slot in the bracket that holds a team."""
 
@@ -51,16 +154,28 @@ class BracketSlot:
     seed: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayoffBracket:
     """Double-elimination playoff bracket for 8 teams."""
 
     teams: list[Team] = field(default_factory=list)  # Seeded 1-8
-    matches: dict[BracketPosition, Match] = field(default_factory=dict)
-    results: dict[BracketPosition, MatchResult] = field(default_factory=dict)
 
-    # Track eliminated teams
-    eliminated: set[Team] = field(default_factory=set)
+    # Indexed by BracketPosition; None until created / played
+    matches: list[Optional[Match]] = field(
+        default_factory=lambda: [None] * NUM_POSITIONS
+    )
+    results: list[Optional[MatchResult]] = field(
+        default_factory=lambda: [None] * NUM_POSITIONS
+    )
+
+    # Seed index (0-7) of each team, by team ID
+    team_seed: dict[int, int] = field(default_factory=dict)
+
+    # Eliminated teams as a bitmask over seed indices (bit i = seed i + 1)
+    eliminated: int = 0
+
+    # Positions whose match has both teams and no result yet
+    _ready: set[BracketPosition] = field(default_factory=set, init=False, repr=False)
 
     # Final placements
     champion: Optional[Team] = None
@@ -82,6 +197,7 @@ class PlayoffBracket:
             raise ValueError("Exactly 8 teams required for playoffs")
 
         self.teams = seeded_teams
+        self.team_seed = {team.id: i for i, team in enumerate(seeded_teams)}
 
         # Create upper bracket quarterfinal matches
         self.matches[BracketPosition.UPPER_QF_1] = Match(
@@ -89,176 +205,96 @@ class PlayoffBracket:
             team_b=seeded_teams[7],  # Seed 8
             format=MatchFormat.BO3,
             stage="upper_qf",
+            id=BracketPosition.UPPER_QF_1,
         )
         self.matches[BracketPosition.UPPER_QF_2] = Match(
             team_a=seeded_teams[3],  # Seed 4
             team_b=seeded_teams[4],  # Seed 5
             format=MatchFormat.BO3,
             stage="upper_qf",
+            id=BracketPosition.UPPER_QF_2,
         )
         self.matches[BracketPosition.UPPER_QF_3] = Match(
             team_a=seeded_teams[1],  # Seed 2
             team_b=seeded_teams[6],  # Seed 7
             format=MatchFormat.BO3,
             stage="upper_qf",
+            id=BracketPosition.UPPER_QF_3,
         )
         self.matches[BracketPosition.UPPER_QF_4] = Match(
             team_a=seeded_teams[2],  # Seed 3
             team_b=seeded_teams[5],  # Seed 6
             format=MatchFormat.BO3,
             stage="upper_qf",
+            id=BracketPosition.UPPER_QF_4,
+        )
+        self._ready.update(
+            (
+                BracketPosition.UPPER_QF_1,
+                BracketPosition.UPPER_QF_2,
+                BracketPosition.UPPER_QF_3,
+                BracketPosition.UPPER_QF_4,
+            )
         )
 
     def record_result(self, position: BracketPosition, result: MatchResult) -> None:
         """Record a match result and update bracket progression."""
         self.results[position] = result
+        self._ready.discard(position)
         self._update_bracket_progression(position, result)
 
     def _update_bracket_progression(
         self, position: BracketPosition, result: MatchResult
     ) -> None:
         """Update bracket based on match result."""
-        winner = result.winner
-        loser = result.loser
-
-        # Upper Bracket Quarterfinals -> Upper Semifinals + Lower R1
-        if position == BracketPosition.UPPER_QF_1:
-            self._set_or_create_match(BracketPosition.UPPER_SF_1, winner, is_team_a=True)
-            self._set_or_create_match(BracketPosition.LOWER_R1_1, loser, is_team_a=True)
-        elif position == BracketPosition.UPPER_QF_2:
-            self._set_or_create_match(
-                BracketPosition.UPPER_SF_1, winner, is_team_a=False
-            )
-            self._set_or_create_match(
-                BracketPosition.LOWER_R1_1, loser, is_team_a=False
-            )
-        elif position == BracketPosition.UPPER_QF_3:
-            self._set_or_create_match(BracketPosition.UPPER_SF_2, winner, is_team_a=True)
-            self._set_or_create_match(BracketPosition.LOWER_R1_2, loser, is_team_a=True)
-        elif position == BracketPosition.UPPER_QF_4:
-            self._set_or_create_match(
-                BracketPosition.UPPER_SF_2, winner, is_team_a=False
-            )
-            self._set_or_create_match(
-                BracketPosition.LOWER_R1_2, loser, is_team_a=False
-            )
+        winner_dest, winner_is_a, loser_dest, loser_is_a, loser_place = TRANSITIONS[
+            position
+        ]
 
-        # Upper Semifinals -> Upper Final + Lower R2
-        elif position == BracketPosition.UPPER_SF_1:
-            self._set_or_create_match(
-                BracketPosition.UPPER_FINAL, winner, is_team_a=True, fmt=MatchFormat.BO5
-            )
-            self._set_or_create_match(
-                BracketPosition.LOWER_R2_1, loser, is_team_a=False
-            )
-        elif position == BracketPosition.UPPER_SF_2:
-            self._set_or_create_match(
-                BracketPosition.UPPER_FINAL, winner, is_team_a=False, fmt=MatchFormat.BO5
-            )
-            self._set_or_create_match(
-                BracketPosition.LOWER_R2_2, loser, is_team_a=False
-            )
-
-        # Upper Final -> Grand Final (winner side)
-        elif position == BracketPosition.UPPER_FINAL:
-            self._set_or_create_match(
-                BracketPosition.GRAND_FINAL, winner, is_team_a=True, fmt=MatchFormat.BO5
-            )
-            self._set_or_create_match(
-                BracketPosition.LOWER_FINAL, loser, is_team_a=False, fmt=MatchFormat.BO5
-            )
-
-        # Lower R1 -> Lower R2
-        elif position == BracketPosition.LOWER_R1_1:
-            self._set_or_create_match(BracketPosition.LOWER_R2_1, winner, is_team_a=True)
-            self.eliminated.add(loser)
-        elif position == BracketPosition.LOWER_R1_2:
-            self._set_or_create_match(BracketPosition.LOWER_R2_2, winner, is_team_a=True)
-            self.eliminated.add(loser)
-
-        # Lower R2 -> Lower SF
-        elif position == BracketPosition.LOWER_R2_1:
-            self._set_or_create_match(
-                BracketPosition.LOWER_SF, winner, is_team_a=True, fmt=MatchFormat.BO5
-            )
-            self.eliminated.add(loser)
-        elif position == BracketPosition.LOWER_R2_2:
-            self._set_or_create_match(
-                BracketPosition.LOWER_SF, winner, is_team_a=False, fmt=MatchFormat.BO5
-            )
-            self.eliminated.add(loser)
-
-        # Lower SF -> Lower Final
-        elif position == BracketPosition.LOWER_SF:
-            self._set_or_create_match(
-                BracketPosition.LOWER_FINAL, winner, is_team_a=True, fmt=MatchFormat.BO5
-            )
-            self.fourth_place = loser
-            self.eliminated.add(loser)
-
-        # Lower Final -> Grand Final (loser side)
-        elif position == BracketPosition.LOWER_FINAL:
-            self._set_or_create_match(
-                BracketPosition.GRAND_FINAL, winner, is_team_a=False, fmt=MatchFormat.BO5
-            )
-            self.third_place = loser
-            self.eliminated.add(loser)
-
-        # Grand Final
-        elif position == BracketPosition.GRAND_FINAL:
-            self.champion = winner
-            self.runner_up = loser
-            self.eliminated.add(loser)
+        if winner_dest < 0:
+            self.champion = result.winner
+        else:
+            self._set_or_create_match(winner_dest, result.winner, is_team_a=winner_is_a)
+
+        if loser_dest < 0:
+            self.eliminated |= 1 << self.team_seed[result.loser.id]
+            if loser_place == 2:
+                self.runner_up = result.loser
+            elif loser_place == 3:
+                self.third_place = result.loser
+            elif loser_place == 4:
+                self.fourth_place = result.loser
+        else:
+            self._set_or_create_match(loser_dest, result.loser, is_team_a=loser_is_a)
 
     def _set_or_create_match(
         self,
         position: BracketPosition,
         team: Team,
         is_team_a: bool,
-        fmt: MatchFormat = MatchFormat.BO3,
     ) -> None:
         """Set a team in a match slot, creating the match if needed."""
-        if position not in self.matches:
-            if is_team_a:
-                self.matches[position] = Match(
-                    team_a=team,
-                    team_b=team,  # Placeholder, will be replaced
-                    format=fmt,
-                    stage=position.name.lower(),
-                )
-            else:
-                self.matches[position] = Match(
-                    team_a=team,  # Placeholder
-                    team_b=team,
-                    format=fmt,
-                    stage=position.name.lower(),
-                )
+        match = self.matches[position]
+        if match is None:
+            # The other slot stays None until its team arrives
+            self.matches[position] = Match(
+                team_a=team if is_team_a else None,
+                team_b=None if is_team_a else team,
+                format=FORMATS[position],
+                stage=_STAGE_NAME[position],
+                id=position,
+            )
         else:
-            match = self.matches[position]
             if is_team_a:
-                self.matches[position] = Match(
-                    team_a=team,
-                    team_b=match.team_b,
-                    format=match.format,
-                    stage=match.stage,
-                    id=match.id,
-                )
+                match.team_a = team
             else:
-                self.matches[position] = Match(
-                    team_a=match.team_a,
-                    team_b=team,
-                    format=match.format,
-                    stage=match.stage,
-                    id=match.id,
-                )
+                match.team_b = team
+            if self.results[position] is None:
+                self._ready.add(position)
 
     def get_next_matches(self) -> list[tuple[BracketPosition, Match]]:
         """Get all matches that are ready to be played (both teams set, not completed)."""
-        ready = []
-        for pos, match in self.matches.items():
-            if pos not in self.results and match.team_a != match.team_b:
-                ready.append((pos, match))
-        return ready
+        return [(position, self.matches[position]) for position in sorted(self._ready)]
 
     def is_complete(self) -> bool:
         """Check if the bracket is complete."""
@@ -266,6 +302,7 @@ class PlayoffBracket:
 
     def get_placement(self, team: Team) -> Optional[int]:
         """Get final placement for a team (1-8)."""
+        seed = self.team_seed.get(team.id)
         if team == self.champion:
             return 1
         elif team == self.runner_up:
@@ -274,7 +311,77 @@ class PlayoffBracket:
             return 3
         elif team == self.fourth_place:
             return 4
-        elif team in self.eliminated:
+        elif seed is not None and (self.eliminated >> seed) & 1:
             # 5th-8th based on when eliminated
             return 5  # Simplified; could track exact round
         return None
+
+
+def simulate_brackets(
+    seed_rows: np.ndarray, thresholds: np.ndarray, draws: np.ndarray
+) -> np.ndarray:
+    """
+    Play out many brackets at once, from pre-drawn games.
+
+    A series is won by whoever takes the majority of its
+    2 * games_to_win - 1 draws, which is whoever reaches games_to_win first
+    (see Tournament.simulate_remaining). The Numba kernel plays the brackets
+    when available (in parallel), else one vectorized NumPy step runs per
+    bracket level; both give the same placements for the same draws.
+
+    Args:
+        seed_rows: Rows (e.g. standings rows) of seeds 1-8 in each trial,
+            shape (n_trials, 8)
+        thresholds: P(row i beats row j in a game) as uint32 fixed-point
+            thresholds (see lec_sim.fixed_point)
+        draws: uint32 game draws, shape
+            (n_trials, NUM_POSITIONS, MAX_SERIES_GAMES); the match at each
+            position reads the first 2 * games_to_win - 1 of its row
+
+    Returns:
+        Rows in final placement order (1st to 8th), shape (n_trials, 8)
+    """
+    # Imported here so that importing the bracket does not load Numba
+    from lec_sim._kernels import HAVE_NUMBA, play_brackets
+
+    seed_rows = np.asarray(seed_rows, dtype=np.intp)
+    n_trials = seed_rows.shape[0]
+    placed = np.empty((n_trials, 8), dtype=np.intp)
+
+    if HAVE_NUMBA:
+        play_brackets(
+            seed_rows, thresholds, draws, BRACKET_SLOTS, PLACEMENT_SLOTS, placed
+        )
+        return placed
+
+    # slots[:, position] = (team_a, team_b) of the match at each position
+    slots = np.empty((n_trials, NUM_POSITIONS, 2), dtype=np.intp)
+    slots[:, : len(_QF_SEEDS)] = seed_rows[:, _QF_SEEDS]
+
+    for level in _LEVELS:
+        a = slots[:, level, 0]
+        b = slots[:, level, 1]
+
+        games_to_win = _GAMES_TO_WIN[level]
+        games = 2 * games_to_win - 1
+        max_games = int(games.max())
+        game_won = draws[:, level, :max_games] < thresholds[a, b][..., None]
+        game_won &= np.arange(max_games) < games[:, None]
+        a_wins = game_won.sum(axis=2) >= games_to_win
+
+        winners = np.where(a_wins, a, b)
+        losers = np.where(a_wins, b, a)
+
+        # Send both teams on, table-driven
+        winner_dest, winner_is_a, loser_dest, loser_is_a, loser_place = (
+            _TRANSITION_TABLE[level].T
+        )
+        moves = winner_dest >= 0
+        slots[:, winner_dest[moves], 1 - winner_is_a[moves]] = winners[:, moves]
+        for k in np.flatnonzero(~moves):  # Grand final winner
+            placed[:, 0] = winners[:, k]
+        moves = loser_dest >= 0
+        slots[:, loser_dest[moves], 1 - loser_is_a[moves]] = losers[:, moves]
+        placed[:, loser_place[~moves] - 1] = losers[:, ~moves]
+
+    return placed
@@ -1,8 +1,11 @@
 """Round-robin tournament stage logic."""
 
+from collections import defaultdict
 from itertools import combinations
 from typing import Iterator
 
+import numpy as np
+
 from lec_sim.models.team import Team
 from lec_sim.models.match import Match, MatchFormat
 
@@ -21,18 +24,20 @@ def generate_round_robin_schedule(
         format: Match format (default Bo1)
 
     Returns:
-        List of Match objects (unplayed)
+        List of Match objects (unplayed), each with its list index as ID
     """
-    matches = []
-    for team_a, team_b in combinations(teams, 2):
-        match = Match(
-            team_a=team_a,
-            team_b=team_b,
+    # Index pairs (i < j) in the same order as itertools.combinations
+    pair_a, pair_b = np.triu_indices(len(teams), k=1)
+    return [
+        Match(
+            team_a=teams[a],
+            team_b=teams[b],
             format=format,
             stage="round_robin",
+            id=i,
         )
-        matches.append(match)
-    return matches
+        for i, (a, b) in enumerate(zip(pair_a.tolist(), pair_b.tolist()))
+    ]
 
 
 def get_remaining_matches(matches: list[Match]) -> list[Match]:
@@ -46,10 +51,24 @@ def get_completed_matches(matches: list[Match]) -> list[Match]:
 
 
 def get_matches_for_team(matches: list[Match], team: Team) -> list[Match]:
-    """Get all matches involving a specific team."""
+    """
+    Get all matches involving a specific team.
+
+    Scans the whole list; to look up many teams, build index_matches_by_team
+    once instead.
+    """
     return [m for m in matches if m.team_a == team or m.team_b == team]
 
 
+def index_matches_by_team(matches: list[Match]) -> dict[Team, list[Match]]:
+    """Map each team to its matches (in schedule order), in one pass."""
+    by_team: defaultdict[Team, list[Match]] = defaultdict(list)
+    for m in matches:
+        by_team[m.team_a].append(m)
+        by_team[m.team_b].append(m)
+    return dict(by_team)
+
+
 def iter_matchups(teams: list[Team]) -> Iterator[tuple[Team, Team]]:
     """Iterate over all possible matchups."""
     yield from combinations(teams, 2)
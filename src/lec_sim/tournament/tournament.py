@@ -1,19 +1,40 @@
 """Main tournament orchestration."""
 
-from collections import defaultdict
 from dataclasses import dataclass, field
+from itertools import compress, pairwise
 from typing import Optional
 import random
 
+import numpy as np
+
+from lec_sim.fixed_point import FIXED_POINT_ONE
 from lec_sim.models.team import Team
 from lec_sim.models.match import Match, MatchResult
 from lec_sim.models.standing import Standings, TeamStanding
-from lec_sim.tournament.round_robin import generate_round_robin_schedule
+from lec_sim.tournament.round_robin import (
+    generate_round_robin_schedule,
+    index_matches_by_team,
+)
 from lec_sim.tournament.playoffs import PlayoffBracket, BracketPosition
 from lec_sim.tiebreaker.resolver import TiebreakerChain
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class PackedMatches:
+    """
+    Round-robin matches packed as parallel arrays, for simulate_remaining.
+
+    Built by Tournament.pack_remaining once per set of win rates, since the
+    matches and their probabilities are the same in every simulation.
+    """
+
+    a_idx: np.ndarray  # Standings rows of team_a
+    b_idx: np.ndarray  # Standings rows of team_b
+    threshold: np.ndarray  # P(team_a wins a game), uint32 fixed point
+    games_to_win: np.ndarray
+
+
+@dataclass(slots=True)
 class Tournament:
     """
     Main tournament orchestration class.
@@ -26,36 +47,191 @@ class Tournament:
     round_robin_matches: list[Match] = field(default_factory=list)
     playoff_bracket: Optional[PlayoffBracket] = None
 
-    # Track which matches have been played
-    _completed_match_ids: set = field(default_factory=set)
+    # match_grid[a, b] = match ID of the round-robin match between the teams
+    # in standings rows a and b (symmetric), or -1 if they don't meet
+    match_grid: np.ndarray = field(init=False, repr=False)
+
+    # Round-robin schedule as parallel arrays indexed by match ID
+    # (round-robin match IDs are their position in round_robin_matches):
+    # schedule[0], schedule[1] = standings rows of team_a, team_b
+    # schedule[2] = games to win
+    schedule: np.ndarray = field(init=False, repr=False)
+
+    # Mutable result columns, indexed by match ID:
+    # results[0] = standings row of the winner, or -1 while unplayed
+    # results[1], results[2] = games won by team_a, team_b
+    results: np.ndarray = field(init=False, repr=False)
+
+    # team -> its round-robin matches, in schedule order
+    _matches_by_team: dict[Team, list[Match]] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        """Initialize standings if empty."""
+        """Initialize standings if empty, and index the schedule."""
         if len(self.standings) == 0:
-            for team in self.teams:
-                self.standings.add_team(team)
+            self.standings = Standings(self.teams)
+        self._index_schedule()
+
+    def __setattr__(self, name: str, value: object) -> None:
+        object.__setattr__(self, name, value)
+        # The schedule arrays are derived from round_robin_matches, so a new
+        # list is indexed as soon as it is set (once __post_init__ has run)
+        if name == "round_robin_matches" and hasattr(self, "schedule"):
+            self._index_schedule()
+
+    def _index_schedule(self) -> None:
+        """(Re)build the schedule arrays and team index from round_robin_matches."""
+        rows = self.standings.team_index
+        self.match_grid = np.full((len(self.teams), len(self.teams)), -1, dtype=np.int16)
+        self.schedule = np.full((3, len(self.round_robin_matches)), -1, dtype=np.int16)
+        self.results = np.full((3, len(self.round_robin_matches)), -1, dtype=np.int16)
+        for i, m in enumerate(self.round_robin_matches):
+            # Match IDs are list positions, whatever built the list
+            m.id = i
+            a, b = rows[m.team_a.id], rows[m.team_b.id]
+            self.match_grid[a, b] = self.match_grid[b, a] = m.id
+            self.schedule[:, m.id] = (a, b, m.format.games_to_win)
+            if m.result is not None:
+                self._set_result_columns(m, m.result)
+        self._matches_by_team = index_matches_by_team(self.round_robin_matches)
 
     @classmethod
     def create_new(cls, teams: list[Team]) -> "Tournament":
         """Create a new tournament with full round-robin schedule."""
-        tournament = cls(teams=teams)
-        tournament.round_robin_matches = generate_round_robin_schedule(teams)
-        return tournament
+        return cls(teams=teams, round_robin_matches=generate_round_robin_schedule(teams))
 
     def get_remaining_round_robin_matches(self) -> list[Match]:
         """Get all round-robin matches that haven't been played."""
-        return [m for m in self.round_robin_matches if not m.is_completed]
+        return list(compress(self.round_robin_matches, self.results[0] < 0))
 
     def get_completed_round_robin_matches(self) -> list[Match]:
         """Get all round-robin matches that have been played."""
-        return [m for m in self.round_robin_matches if m.is_completed]
+        return list(compress(self.round_robin_matches, self.results[0] >= 0))
+
+    def get_remaining_match_ids(self) -> np.ndarray:
+        """Get the IDs of all round-robin matches that haven't been played."""
+        return np.flatnonzero(self.results[0] < 0)
+
+    def get_matches_for_team(self, team: Team) -> list[Match]:
+        """Get all round-robin matches involving a team, in schedule order."""
+        return list(self._matches_by_team.get(team, ()))
 
     def record_round_robin_result(self, match: Match, result: MatchResult) -> None:
         """Record a round-robin match result."""
         match.result = result
-        self._completed_match_ids.add(match.id)
+        self._set_result_columns(match, result)
         self.standings.record_match_result(result.winner, result.loser)
 
+    def _set_result_columns(self, match: Match, result: MatchResult) -> None:
+        """Write a match result into the result columns."""
+        a_won = result.winner == match.team_a
+        self.results[:, match.id] = (
+            self.standings.team_index[result.winner.id],
+            result.winner_score if a_won else result.loser_score,
+            result.loser_score if a_won else result.winner_score,
+        )
+
+    def pack_remaining(
+        self, thresholds: np.ndarray, remaining: Optional[list[Match]] = None
+    ) -> PackedMatches:
+        """
+        Pack the unplayed round-robin matches for simulate_remaining.
+
+        Pack again after recording results: the packed matches do not follow
+        the result columns.
+
+        Args:
+            thresholds: P(standings row i beats row j in a game) as uint32
+                fixed-point thresholds (see lec_sim.fixed_point)
+            remaining: The unplayed matches, if the caller already has them
+                (e.g. from get_remaining_round_robin_matches); found from the
+                result columns otherwise
+        """
+        if remaining is None:
+            ids = self.get_remaining_match_ids()
+        else:
+            ids = np.fromiter(
+                (m.id for m in remaining), dtype=np.intp, count=len(remaining)
+            )
+        a_idx = self.schedule[0, ids].astype(np.intp)
+        b_idx = self.schedule[1, ids].astype(np.intp)
+        return PackedMatches(
+            a_idx=a_idx,
+            b_idx=b_idx,
+            threshold=np.asarray(thresholds, dtype=np.uint32)[a_idx, b_idx],
+            games_to_win=self.schedule[2, ids].astype(np.intp),
+        )
+
+    def simulate_remaining(
+        self,
+        remaining: PackedMatches,
+        n_trials: int,
+        rng: Optional[np.random.Generator] = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Play the unplayed round-robin matches on top of the current standings,
+        n_trials times.
+
+        Every game draw is taken from rng up front, in one call, so results
+        depend only on the generator. The draws are tallied by the Numba
+        kernel when available (trials run in parallel), else by a vectorized
+        NumPy pass; both give the same results.
+
+        Bo3/Bo5 series are decided by drawing every game a series could need
+        (2 * games_to_win - 1): whoever wins the majority of those games is
+        exactly whoever reaches games_to_win first, so the winner is the same
+        as playing the series out game by game.
+
+        Args:
+            remaining: The unplayed matches, from pack_remaining
+            n_trials: Number of independent trials
+            rng: Source of the game draws; a fresh Generator if None
+
+        Returns:
+            Final (wins, losses, h2h) standings arrays with a leading
+            n_trials axis
+        """
+        # Imported here so that importing the tournament does not load Numba
+        from lec_sim._kernels import HAVE_NUMBA, tally_round_robin_draws
+
+        if rng is None:
+            rng = np.random.default_rng()
+
+        a_idx, b_idx = remaining.a_idx, remaining.b_idx
+        threshold, games_to_win = remaining.threshold, remaining.games_to_win
+        games = 2 * games_to_win - 1
+
+        base_wins, base_losses, base_h2h = self.standings.snapshot()
+        wins = np.broadcast_to(base_wins, (n_trials, *base_wins.shape)).copy()
+        losses = np.broadcast_to(base_losses, (n_trials, *base_losses.shape)).copy()
+        h2h = np.broadcast_to(base_h2h, (n_trials, *base_h2h.shape)).copy()
+
+        # Enough draws for the longest series; shorter series ignore the rest
+        max_games = int(games.max(initial=1))
+        draws = rng.integers(
+            0, FIXED_POINT_ONE, size=(n_trials, len(a_idx), max_games), dtype=np.uint32
+        )
+
+        if HAVE_NUMBA:
+            tally_round_robin_draws(
+                a_idx, b_idx, threshold, games_to_win, draws, wins, losses, h2h
+            )
+            return wins, losses, h2h
+
+        game_won = draws < threshold[:, None]
+        if max_games > 1:
+            # Ignore the padding games beyond each match's own series length
+            game_won &= np.arange(max_games) < games[:, None]
+        a_wins = game_won.sum(axis=2) >= games_to_win
+
+        winners = np.where(a_wins, a_idx, b_idx)
+        losers = np.where(a_wins, b_idx, a_idx)
+        trials = np.arange(n_trials)[:, None]
+        np.add.at(wins, (trials, winners), 1)
+        np.add.at(losses, (trials, losers), 1)
+        np.add.at(h2h, (trials, winners, losers, 0), 1)
+        np.add.at(h2h, (trials, losers, winners, 1), 1)
+        return wins, losses, h2h
+
     def resolve_standings(
         self, rng: Optional[random.Random] = None
     ) -> list[TeamStanding]:
@@ -64,21 +240,29 @@ class Tournament:
 
         Returns teams ordered from 1st to 12th (or however many teams).
         """
-        # Group teams by win count
-        by_wins: dict[int, list[TeamStanding]] = defaultdict(list)
-        for standing in self.standings.standings.values():
-            by_wins[standing.wins].append(standing)
+        # Rows by wins (descending); ties keep standings order
+        standings = self.standings
+        wins = standings.wins
+        order = np.argsort(-wins, kind="stable")
+        views = [standings.standings[standings.teams[i].id] for i in order.tolist()]
+
+        # Group boundaries: where the win count changes
+        bounds = [0, *(np.flatnonzero(np.diff(wins[order])) + 1).tolist(), len(order)]
+
+        # Common case: every win total is distinct, so there is nothing to break
+        if len(bounds) == len(views) + 1:
+            return views
 
         # Resolve ties within each win group
         tiebreaker_chain = TiebreakerChain(rng=rng)
         final_order: list[TeamStanding] = []
 
-        for wins in sorted(by_wins.keys(), reverse=True):
-            group = by_wins[wins]
+        for start, end in pairwise(bounds):
+            group = views[start:end]
             if len(group) == 1:
                 final_order.extend(group)
             else:
-                result = tiebreaker_chain.resolve(group, self.standings)
+                result = tiebreaker_chain.resolve(group, standings)
                 final_order.extend(result.ordered_teams)
 
         return final_order
@@ -97,15 +281,9 @@ class Tournament:
 
     def copy(self) -> "Tournament":
         """Create a deep copy of the tournament for simulation."""
-        new_tournament = Tournament(
-            teams=self.teams,  # Teams are immutable, can share
-            standings=self.standings.copy(),
-            round_robin_matches=[],  # Will rebuild
-        )
-
         # Deep copy matches
-        for match in self.round_robin_matches:
-            new_match = Match(
+        matches = [
+            Match(
                 team_a=match.team_a,
                 team_b=match.team_b,
                 format=match.format,
@@ -115,7 +293,11 @@ class Tournament:
                 result=match.result,  # MatchResult is immutable
                 id=match.id,
             )
-            new_tournament.round_robin_matches.append(new_match)
+            for match in self.round_robin_matches
+        ]
 
-        new_tournament._completed_match_ids = set(self._completed_match_ids)
-        return new_tournament
+        return Tournament(
+            teams=self.teams,  # Teams are immutable, can share
+            standings=self.standings.copy(),
+            round_robin_matches=matches,
+        )
@@ -0,0 +1,84 @@
+"""Tests for the simulation engine's aggregated results."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from lec_sim.io import results as results_io
+from lec_sim.io.state_loader import create_empty_tournament
+from lec_sim.models.match import MatchResult
+from lec_sim.simulation.engine import SimulationConfig, SimulationEngine
+from lec_sim.simulation.win_rates import WinRateMatrix
+
+
+def _run(num_workers: int = 1):
+    """A seeded run over several chunks, from a part-played season."""
+    tournament = create_empty_tournament()
+    for match in tournament.round_robin_matches[::3]:
+        tournament.record_round_robin_result(
+            match, MatchResult(match.team_a, match.team_b, 1, 0)
+        )
+    elos = {team.id: 1500 + 20 * i for i, team in enumerate(tournament.teams)}
+    config = SimulationConfig(num_simulations=5000, seed=3, num_workers=num_workers)
+    engine = SimulationEngine(tournament, WinRateMatrix.from_elo_ratings(elos), config)
+    return engine.run()
+
+
+@pytest.fixture(scope="module")
+def results():
+    return _run()
+
+
+def test_probabilities_sum_to_one(results):
+    assert results.num_simulations == 5000
+    for rank in range(1, 13):
+        total = sum(
+            dist.get(rank, 0) for dist in results.regular_season_distribution.values()
+        )
+        assert total == pytest.approx(1)
+    for seed in range(1, 9):
+        total = sum(dist.get(seed, 0) for dist in results.seeding_distribution.values())
+        assert total == pytest.approx(1)
+    for place in range(1, 9):
+        total = sum(
+            dist.get(place, 0)
+            for dist in results.playoff_placement_distribution.values()
+        )
+        assert total == pytest.approx(1)
+    assert sum(results.playoff_probability.values()) == pytest.approx(8)
+    assert sum(results.championship_probability.values()) == pytest.approx(1)
+
+
+def test_counts_merge_across_workers(results):
+    """Chunks merged across worker processes give the same results."""
+    assert _run(num_workers=2) == results
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_results_json_round_trips(results, tmp_path, monkeypatch, use_orjson):
+    if use_orjson and results_io.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(results_io, "orjson", None)
+
+    timestamp = datetime(2026, 1, 2, 3, 4, 5)
+    path = results_io.save_results_to_json(
+        results, tmp_path / "results.json", timestamp=timestamp
+    )
+    with open(path) as f:
+        data = json.load(f)
+
+    assert data["timestamp"] == timestamp.isoformat()
+    loaded = data["results"]
+    # JSON object keys are strings; ranks, seeds and places come back as str
+    for key in (
+        "regular_season_distribution",
+        "seeding_distribution",
+        "playoff_placement_distribution",
+    ):
+        loaded[key] = {
+            team: {int(position): prob for position, prob in dist.items()}
+            for team, dist in loaded[key].items()
+        }
+    assert loaded == results.to_dict()
@@ -0,0 +1,31 @@
+"""Tests for the fixed-point probability thresholds."""
+
+import numpy as np
+import pytest
+
+from lec_sim.fixed_point import FIXED_POINT_ONE, to_fixed_point
+
+
+def test_exact_thresholds():
+    thresholds = to_fixed_point(np.array([0.0, 0.5, 0.25]))
+    assert thresholds.dtype == np.uint32
+    assert thresholds.tolist() == [0, 1 << 31, 1 << 30]
+
+
+def test_one_saturates():
+    assert to_fixed_point(np.array([1.0, 1.0 - 2.0**-40])).tolist() == [
+        FIXED_POINT_ONE - 1,
+        FIXED_POINT_ONE - 1,
+    ]
+
+
+def test_rounding_error_is_within_one_step():
+    probs = np.random.default_rng(0).random(10_000)
+    error = to_fixed_point(probs) / FIXED_POINT_ONE - probs
+    assert np.abs(error).max() <= 2.0**-32
+
+
+@pytest.mark.parametrize("prob", [-0.01, 1.01])
+def test_out_of_range_raises(prob):
+    with pytest.raises(ValueError):
+        to_fixed_point(np.array([prob]))
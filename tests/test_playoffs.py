@@ -0,0 +1,105 @@
+"""Tests for the batch bracket simulator against PlayoffBracket."""
+
+import numpy as np
+import pytest
+
+from lec_sim import _kernels
+from lec_sim.fixed_point import FIXED_POINT_ONE, to_fixed_point
+from lec_sim.models.match import MatchResult
+from lec_sim.models.team import Team
+from lec_sim.tournament.playoffs import (
+    FORMATS,
+    MAX_SERIES_GAMES,
+    NUM_POSITIONS,
+    BracketPosition,
+    PlayoffBracket,
+    simulate_brackets,
+)
+
+NUM_TEAMS = 10
+
+
+def _play_bracket(
+    seed_rows: np.ndarray, thresholds: np.ndarray, draws: np.ndarray
+) -> list[int]:
+    """Play a PlayoffBracket game by game from the draws; rows by placement."""
+    teams = [Team(name=f"Team {i}", short_name=f"T{i}") for i in range(NUM_TEAMS)]
+    rows = {team.id: i for i, team in enumerate(teams)}
+
+    bracket = PlayoffBracket()
+    bracket.seed_teams([teams[row] for row in seed_rows])
+    while not bracket.is_complete():
+        for position, match in bracket.get_next_matches():
+            a, b = rows[match.team_a.id], rows[match.team_b.id]
+            games_to_win = FORMATS[position].games_to_win
+            a_games = b_games = 0
+            for won in draws[position] < thresholds[a, b]:
+                if max(a_games, b_games) == games_to_win:
+                    break
+                a_games += int(won)
+                b_games += int(not won)
+            if a_games > b_games:
+                result = MatchResult(match.team_a, match.team_b, a_games, b_games)
+            else:
+                result = MatchResult(match.team_b, match.team_a, b_games, a_games)
+            bracket.record_result(position, result)
+
+    placed = [
+        bracket.champion,
+        bracket.runner_up,
+        bracket.third_place,
+        bracket.fourth_place,
+        *(
+            bracket.results[position].loser
+            for position in (
+                BracketPosition.LOWER_R2_1,
+                BracketPosition.LOWER_R2_2,
+                BracketPosition.LOWER_R1_1,
+                BracketPosition.LOWER_R1_2,
+            )
+        ),
+    ]
+    return [rows[team.id] for team in placed]
+
+
+def _fixture(n_trials: int = 300):
+    rng = np.random.default_rng(7)
+    probs = rng.random((NUM_TEAMS, NUM_TEAMS))
+    probs = np.triu(probs, 1) + np.tril(1.0 - probs.T, -1)
+    # Certain results: row 0 beats everyone, row 1 loses to everyone
+    probs[0, :], probs[:, 0] = 1.0, 0.0
+    probs[1, 2:], probs[2:, 1] = 0.0, 1.0
+    seed_rows = np.array([rng.permutation(NUM_TEAMS)[:8] for _ in range(n_trials)])
+    draws = rng.integers(
+        0,
+        FIXED_POINT_ONE,
+        size=(n_trials, NUM_POSITIONS, MAX_SERIES_GAMES),
+        dtype=np.uint32,
+    )
+    # Include the extreme draws
+    draws[:, :, 0] = 0
+    draws[::2, :, 1] = FIXED_POINT_ONE - 1
+    return seed_rows, to_fixed_point(probs), draws
+
+
+@pytest.mark.parametrize("have_numba", [True, False])
+def test_simulate_brackets_matches_playoff_bracket(monkeypatch, have_numba):
+    """Both batch backends place every team as PlayoffBracket does."""
+    if have_numba and not _kernels.HAVE_NUMBA:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(_kernels, "HAVE_NUMBA", have_numba)
+
+    seed_rows, thresholds, draws = _fixture()
+    placed = simulate_brackets(seed_rows, thresholds, draws)
+
+    expected = [
+        _play_bracket(rows, thresholds, trial_draws)
+        for rows, trial_draws in zip(seed_rows, draws)
+    ]
+    assert placed.tolist() == expected
+
+    # Row 0 takes every series it plays, and row 1 never gets past lower R1
+    has_0 = (seed_rows == 0).any(axis=1)
+    assert (placed[has_0, 0] == 0).all()
+    has_1 = (seed_rows == 1).any(axis=1)
+    assert np.isin(placed[has_1, 6:], 1).any(axis=1).all()
@@ -0,0 +1,167 @@
+"""Tests for the array tiebreaker against the TiebreakerChain rules."""
+
+import random
+
+import numpy as np
+import pytest
+
+from lec_sim import _kernels
+from lec_sim.io.state_loader import create_empty_tournament
+from lec_sim.models.match import MatchResult
+from lec_sim.models.team import Team
+from lec_sim.tiebreaker.resolver import (
+    HeadToHeadTiebreaker,
+    StrengthOfVictoryTiebreaker,
+    TiebreakerChain,
+    TiebreakerMethod,
+    TiebreakerResult,
+    TiebreakerRule,
+    resolve_order,
+    resolve_orders,
+)
+from lec_sim.tournament.tournament import Tournament
+
+
+def _random_season(seed: int, played: float):
+    """A tournament with a seeded random subset of its matches played."""
+    tournament = create_empty_tournament()
+    rng = random.Random(seed)
+    for match in tournament.round_robin_matches:
+        if rng.random() < played:
+            if rng.random() < 0.5:
+                winner, loser = match.team_a, match.team_b
+            else:
+                winner, loser = match.team_b, match.team_a
+            result = MatchResult(winner, loser, 1, 0)
+            tournament.record_round_robin_result(match, result)
+    return tournament
+
+
+@pytest.mark.parametrize("played", [0.0, 0.5, 0.9, 1.0])
+def test_resolve_order_matches_resolve_standings(played):
+    """Same order, and the same coinflips for the same rng state."""
+    mismatches = []
+    for seed in range(500):
+        tournament = _random_season(seed, played)
+        expected = [s.index for s in tournament.resolve_standings(random.Random(seed))]
+        standings = tournament.standings
+        actual = resolve_order(standings.wins, standings.h2h, random.Random(seed))
+        if actual != expected:
+            mismatches.append(seed)
+    assert mismatches == []
+
+
+class _RankedCoinflip(TiebreakerRule):
+    """Coinflip that settles ties by a fixed ranking of the rows."""
+
+    def __init__(self, coin_rank):
+        self.coin_rank = coin_rank
+
+    def resolve(self, tied_teams, all_standings):
+        ordered = sorted(tied_teams, key=lambda t: self.coin_rank[t.index])
+        return TiebreakerResult(True, TiebreakerMethod.COINFLIP, ordered)
+
+
+@pytest.mark.parametrize("have_numba", [True, False])
+@pytest.mark.parametrize("played", [0.5, 0.9, 1.0])
+def test_resolve_orders_matches_tiebreaker_chain(monkeypatch, have_numba, played):
+    """Same orders as the chain, with coinflips settled by the same ranking."""
+    if have_numba and not _kernels.HAVE_NUMBA:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(_kernels, "HAVE_NUMBA", have_numba)
+
+    seasons = [_random_season(seed, played).standings for seed in range(300)]
+    wins = np.stack([standings.wins for standings in seasons])
+    h2h = np.stack([standings.h2h for standings in seasons])
+    coin_rank = np.random.default_rng(0).permuted(
+        np.tile(np.arange(wins.shape[1]), (len(seasons), 1)), axis=1
+    )
+    orders = resolve_orders(wins, h2h, coin_rank)
+
+    for standings, rank, order in zip(seasons, coin_rank, orders):
+        rules = [
+            HeadToHeadTiebreaker(),
+            StrengthOfVictoryTiebreaker(),
+            _RankedCoinflip(rank),
+        ]
+        chain = TiebreakerChain(rules)
+        expected = []
+        for w in sorted(set(standings.wins.tolist()), reverse=True):
+            result = chain.resolve(standings.get_teams_with_wins(w), standings)
+            expected.extend(s.index for s in result.ordered_teams)
+        assert order.tolist() == expected
+
+
+def _table(names: str, results: list[str]) -> Tournament:
+    """A tournament of one-letter teams with the given "winner loser" results."""
+    teams = [Team(name=name, short_name=name) for name in names]
+    by_name = {team.short_name: team for team in teams}
+    tournament = Tournament(teams)
+    for result in results:
+        winner, loser = result.split()
+        tournament.standings.record_match_result(by_name[winner], by_name[loser])
+    return tournament
+
+
+def _orders(tournament: Tournament, seed: int) -> list[str]:
+    """The order from TiebreakerChain, resolve_order and resolve_orders."""
+    standings = tournament.standings
+    names = [team.short_name for team in standings.teams]
+    chain = tournament.resolve_standings(random.Random(seed))
+    rows = resolve_order(standings.wins, standings.h2h, random.Random(seed))
+    coin_rank = np.random.default_rng(seed).permutation(len(names))
+    batch = resolve_orders(standings.wins[None], standings.h2h[None], coin_rank[None])
+    return [
+        "".join(s.team.short_name for s in chain),
+        "".join(names[row] for row in rows),
+        "".join(names[row] for row in batch[0]),
+    ]
+
+
+def test_three_way_head_to_head_split():
+    """A, B and C are 3-3 with H2H differentials 2, 0 and -2."""
+    tournament = _table(
+        "ABCDEF",
+        [
+            "A B", "A C", "B C",
+            "A D", "B D", "B E", "C D", "C E", "C F",
+            "F D", "F E", "E D",
+        ],
+    )
+    for seed in range(20):
+        assert _orders(tournament, seed) == ["ABCFED"] * 3
+
+
+def test_partial_head_to_head_tie_falls_through_to_sov():
+    """
+    A-D are 3-3. H2H (A beat B, B beat C, C beat D) puts A first and D last;
+    B and C share a differential of 0 and go on to SoV, where C (6) passes
+    B (4) despite losing to B.
+    """
+    tournament = _table(
+        "ABCDXYZ",
+        [
+            "A B", "B C", "C D",
+            "A X", "A Z", "B Y", "B Z", "C X", "C Y", "D X", "D Y", "D Z",
+            "X Y", "X Z", "Y Z",
+        ],
+    )
+    for seed in range(20):
+        assert _orders(tournament, seed) == ["ACBDXYZ"] * 3
+
+
+def test_sov_tie_falls_through_to_coinflip():
+    """P and Q never met and both beat only R, so only a coinflip splits them."""
+    tournament = _table("PQR", ["P R", "Q R"])
+    seen: list[set[str]] = [set(), set(), set()]
+    for seed in range(50):
+        for resolver_seen, order in zip(seen, _orders(tournament, seed)):
+            resolver_seen.add(order)
+    assert seen == [{"PQR", "QPR"}] * 3
+
+    standings = tournament.standings
+    for coin_rank, expected in (([0, 1, 2], [0, 1, 2]), ([1, 0, 2], [1, 0, 2])):
+        orders = resolve_orders(
+            standings.wins[None], standings.h2h[None], np.array([coin_rank])
+        )
+        assert orders[0].tolist() == expected
@@ -0,0 +1,25 @@
+"""Tests for the tournament's schedule arrays."""
+
+from lec_sim.io.state_loader import get_default_teams
+from lec_sim.models.match import MatchResult
+from lec_sim.tournament.round_robin import generate_round_robin_schedule
+from lec_sim.tournament.tournament import Tournament
+
+
+def test_assigned_schedule_is_indexed():
+    """Assigning round_robin_matches after construction rebuilds the arrays."""
+    teams = get_default_teams()
+    tournament = Tournament(teams)
+    tournament.round_robin_matches = generate_round_robin_schedule(teams)
+
+    remaining = tournament.get_remaining_round_robin_matches()
+    assert len(remaining) == 66
+    assert len(tournament.get_matches_for_team(teams[0])) == 11
+
+    match = remaining[0]
+    tournament.record_round_robin_result(
+        match, MatchResult(match.team_a, match.team_b, 1, 0)
+    )
+    assert len(tournament.get_remaining_round_robin_matches()) == 65
+    assert tournament.get_completed_round_robin_matches() == [match]
+    assert tournament.standings.get_by_team(match.team_a).wins == 1
@@ -0,0 +1,35 @@
+"""Tests for the win rate matrix."""
+
+from lec_sim.simulation.win_rates import WinRateMatrix
+
+
+def _matrix() -> WinRateMatrix:
+    matrix = WinRateMatrix()
+    matrix.set_win_probability(0, 1, 0.6)
+    matrix.set_win_probability(1, 2, 0.3)
+    return matrix
+
+
+def test_finalized_matrices_compare_by_probabilities():
+    assert _matrix().finalize() == _matrix()
+    assert _matrix().finalize() != WinRateMatrix.uniform()
+
+
+def test_finalize_keeps_set_probabilities_exact():
+    matrix = _matrix().finalize()
+    assert matrix.get_win_probability(0, 1) == 0.6
+    assert matrix.get_win_probability(1, 0) == 1.0 - 0.6
+    assert matrix.get_win_probability(2, 1) == 1.0 - 0.3
+    assert matrix.get_win_probability(0, 2) == 0.5
+
+
+def test_from_elo_ratings_matches_the_logistic_formula():
+    elos = {0: 1500.0, 1: 1620.0, 2: 1433.5, 3: 1811.0}
+    matrix = WinRateMatrix.from_elo_ratings(elos, k=400)
+    for a, elo_a in elos.items():
+        for b, elo_b in elos.items():
+            if a == b:
+                continue
+            expected = 1 / (1 + 10 ** ((elo_b - elo_a) / 400))
+            assert abs(matrix.get_win_probability(a, b) - expected) < 1e-12
+            assert abs(matrix.matrix[a][b] - expected) < 1e-12